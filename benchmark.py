@@ -0,0 +1,336 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder
+
+from flat_forest import flatten_forest
+from generate_jordan_data import generate_properties, write_stream
+from model_artifact import artifact_path, load_artifact
+from price_properties_model import build_models
+from property_dataset import load_properties, features, target, region_column, region_code_column
+
+default_sizes = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+default_batch_sizes = [1, 10, 100, 1_000, 10_000, 100_000]
+
+# Metrics where a higher value in the current run is a regression
+compared_metrics = ['seconds', 'peak_mb', 'p50_ms', 'p99_ms', 'us_per_row']
+
+
+# ═══════════════════════════════════════
+# Measurement Helpers
+# ═══════════════════════════════════════
+class PeakMemory:
+    # Peak resident memory above the starting point while the block runs.
+    # Samples /proc/self/statm so native allocations (tree builders, BLAS)
+    # are counted; falls back to tracemalloc where /proc is unavailable.
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._use_proc = os.path.exists('/proc/self/statm')
+
+    @staticmethod
+    def _rss():
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self._peak = max(self._peak, self._rss())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        if self._use_proc:
+            self._start = self._peak = self._rss()
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        else:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._use_proc:
+            self._stop.set()
+            self._thread.join()
+            self._peak = max(self._peak, self._rss())
+            self.peak_mb = (self._peak - self._start) / 1e6
+        else:
+            self.peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+        return False
+
+
+def measure(func):
+    with PeakMemory() as memory:
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+    return result, {'seconds': seconds, 'peak_mb': memory.peak_mb}
+
+
+def single_row_frame(row):
+    # The one-row DataFrame the web app builds per click
+    return pd.DataFrame({feature: [value] for feature, value in zip(features, row)})
+
+
+def predict_latency(model, X_test, single_repeats=50, batch_size=1000):
+    rows = X_test.to_numpy()[:single_repeats]
+    single = []
+    for row in rows:
+        start = time.perf_counter()
+        model.predict(single_row_frame(row))
+        single.append(time.perf_counter() - start)
+    single_ms = np.array(single) * 1000
+
+    batch = X_test.iloc[:batch_size]
+    start = time.perf_counter()
+    model.predict(batch)
+    batch_seconds = time.perf_counter() - start
+
+    return (
+        {'p50_ms': float(np.percentile(single_ms, 50)), 'p99_ms': float(np.percentile(single_ms, 99))},
+        {'rows': len(batch), 'seconds': batch_seconds, 'us_per_row': batch_seconds / len(batch) * 1e6},
+    )
+
+
+# ═══════════════════════════════════════
+# Benchmark Run
+# ═══════════════════════════════════════
+def run_size(n_rows, workdir, model_names, max_fit_rows=None, seed=42):
+    records = []
+
+    def record(stage, metrics, model=None):
+        records.append(dict({'size': n_rows, 'stage': stage, 'model': model}, **metrics))
+        label = f"{stage} [{model}]" if model else stage
+        print(f"   {label:<45} " + ", ".join(
+            f"{key}={value:,.3f}" if isinstance(value, float) else f"{key}={value}" for key, value in metrics.items()))
+
+    print(f"\nDataset size: {n_rows:,} rows")
+    csv_file = os.path.join(workdir, f"properties_{n_rows}.csv")
+    columnar_dir = os.path.join(workdir, f"properties_{n_rows}_data")
+    _, generate_seconds = write_stream(n_rows, csv_file, seed=seed, verbose=False)
+    record('generate', {'seconds': generate_seconds})
+
+    df, metrics = measure(lambda: pd.read_csv(csv_file))
+    record('read_csv', metrics)
+
+    _, metrics = measure(lambda: load_properties(columnar_dir, csv_file))
+    record('columnar_convert_load', metrics)
+    _, metrics = measure(lambda: load_properties(columnar_dir, csv_file))
+    record('columnar_load', metrics)
+
+    codes, metrics = measure(lambda: LabelEncoder().fit_transform(df[region_column]))
+    record('label_encoder', metrics)
+
+    df[region_code_column] = codes
+    X_train, X_test, y_train, y_test = train_test_split(df[features], df[target], test_size=0.2, random_state=42)
+    del df
+
+    models = build_models()
+    for name in model_names:
+        if max_fit_rows and len(X_train) > max_fit_rows:
+            record('fit', {'skipped': True}, name)
+            continue
+        model = models[name]
+        _, metrics = measure(lambda: model.fit(X_train, y_train))
+        record('fit', metrics, name)
+
+        single, batch = predict_latency(model, X_test)
+        record('predict_single', single, name)
+        record('predict_batch', batch, name)
+
+    shutil.rmtree(columnar_dir, ignore_errors=True)
+    os.remove(csv_file)
+    return records
+
+
+# ═══════════════════════════════════════
+# Flat Forest Predictor Micro-Benchmark
+# ═══════════════════════════════════════
+def best_of(func, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def run_predictor(path, batch_sizes, seed=42):
+    # model.predict on a DataFrame versus the exported flat arrays, per batch size
+    artifact = load_artifact(path, mmap=False)
+    if not hasattr(artifact.model, 'estimators_'):
+        raise ValueError(f"{path} holds a {artifact.model_name} model, not a forest")
+    flat, export_seconds = best_of(lambda: flatten_forest(artifact.model), 1)
+    print(f"\nExported {flat.n_trees} trees ({flat.n_nodes:,} nodes, depth {flat.depth}) in {export_seconds:.2f}s")
+
+    df = generate_properties(max(batch_sizes), seed=seed)
+    df[region_code_column] = artifact.label_encoder.transform(df[region_column])
+    X = df[features]
+    X_array = X.to_numpy(dtype=np.float32)
+
+    records = []
+    for size in batch_sizes:
+        # Fewer repeats for large batches, enough to settle small ones
+        repeats = max(3, min(200, 20_000 // size))
+        expected, sklearn_seconds = best_of(lambda: artifact.model.predict(X.iloc[:size]), repeats)
+        actual, flat_seconds = best_of(lambda: flat.predict(X_array[:size]), repeats)
+        _, interval_seconds = best_of(lambda: flat.predict_interval(X_array[:size]), repeats)
+        timings = [('sklearn', sklearn_seconds), ('flat', flat_seconds), ('flat_interval', interval_seconds)]
+        if size == 1:
+            one, one_seconds = best_of(lambda: flat.predict_one(X_array[0]), repeats)
+            _, one_interval_seconds = best_of(lambda: flat.predict_one_interval(X_array[0]), repeats)
+            actual = np.array([one])
+            timings += [('flat_one', one_seconds), ('flat_one_interval', one_interval_seconds)]
+            flat_seconds, interval_seconds = one_seconds, one_interval_seconds
+        for model, seconds in timings:
+            records.append({'size': size, 'stage': 'predict', 'model': model, 'seconds': seconds,
+                            'us_per_row': seconds / size * 1e6})
+        max_error = float(np.abs(expected - actual).max())
+        print(f"   batch {size:>7,}: sklearn {sklearn_seconds * 1e3:9.3f} ms, flat {flat_seconds * 1e3:9.3f} ms "
+              f"({sklearn_seconds / flat_seconds:6.1f}x), with interval {interval_seconds * 1e3:9.3f} ms, "
+              f"max |diff| {max_error:.2e} JOD")
+    return records
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'scikit-learn': sklearn.__version__,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def write_results(results, output):
+    if output.endswith('.csv'):
+        pd.DataFrame(results['records']).to_csv(output, index=False)
+    else:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+def read_results(path):
+    if path.endswith('.csv'):
+        return pd.read_csv(path).replace({np.nan: None}).to_dict('records')
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['records']
+
+
+# ═══════════════════════════════════════
+# Baseline Comparison
+# ═══════════════════════════════════════
+def compare_results(baseline, current, threshold=0.2, min_seconds=0.001, min_mb=1.0):
+    # Flag every metric that got worse than the baseline by more than `threshold`
+    def key(record):
+        return record['size'], record['stage'], record.get('model') or ''
+
+    baseline_by_key = {key(record): record for record in baseline}
+    rows = []
+    for record in current:
+        previous = baseline_by_key.get(key(record))
+        if previous is None:
+            continue
+        for metric in compared_metrics:
+            old, new = previous.get(metric), record.get(metric)
+            if old is None or new is None:
+                continue
+            # Ignore timer and page-size noise on near-zero measurements
+            if metric == 'seconds' and max(old, new) < min_seconds:
+                continue
+            if metric == 'peak_mb' and max(old, new) < min_mb:
+                continue
+            change = (new - old) / old if old else 0.0
+            rows.append({'size': record['size'], 'stage': record['stage'], 'model': record.get('model') or '',
+                         'metric': metric, 'baseline': old, 'current': new, 'change': change,
+                         'regression': change > threshold})
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark training and inference across dataset sizes')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmark suite')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=default_sizes, help='Dataset sizes (rows)')
+    run_parser.add_argument('--models', nargs='+', default=list(build_models()), help='Models to fit')
+    run_parser.add_argument('--max-fit-rows', type=int, default=None,
+                            help='Skip model fits on training sets larger than this')
+    run_parser.add_argument('--workdir', default=None, help='Directory for generated datasets (default: temp)')
+    run_parser.add_argument('--output', default='benchmark_results.json', help='Results file (.json or .csv)')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare results against a stored baseline')
+    compare_parser.add_argument('baseline', help='Baseline results file')
+    compare_parser.add_argument('current', help='Current results file')
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help='Relative slowdown/growth flagged as a regression')
+    predictor_parser = subparsers.add_parser('predictor',
+                                             help='Compare the flat forest predictor with model.predict')
+    predictor_parser.add_argument('--artifact', default=artifact_path, help='Artifact holding a fitted forest')
+    predictor_parser.add_argument('--batch-sizes', type=int, nargs='+', default=default_batch_sizes,
+                                  help='Rows per predict call')
+    predictor_parser.add_argument('--output', default=None, help='Results file (.json or .csv)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'predictor':
+        print("=" * 70)
+        print("Flat Forest Predictor vs model.predict")
+        print("=" * 70)
+        records = run_predictor(args.artifact, args.batch_sizes)
+        if args.output:
+            write_results({'environment': environment(), 'records': records}, args.output)
+            print(f"\nResults saved to: {args.output}")
+        return 0
+
+    if args.command == 'compare':
+        report = compare_results(read_results(args.baseline), read_results(args.current), args.threshold)
+        if report.empty:
+            print("No comparable measurements")
+            return 0
+        print(report.to_string(index=False, formatters={'change': '{:+.1%}'.format}))
+        regressions = report[report['regression']]
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1 if len(regressions) else 0
+
+    unknown = sorted(set(args.models) - set(build_models()))
+    if unknown:
+        parser.error(f"unknown models: {unknown}")
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='jordan_benchmark_')
+    os.makedirs(workdir, exist_ok=True)
+    print("=" * 70)
+    print("Jordan Property Price Prediction - Benchmark Suite")
+    print("=" * 70)
+
+    records = []
+    try:
+        for n_rows in args.sizes:
+            records.extend(run_size(n_rows, workdir, args.models, args.max_fit_rows))
+            # Written after every size so a long run keeps its partial results
+            write_results({'environment': environment(), 'records': records}, args.output)
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\nResults saved to: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
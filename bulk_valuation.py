@@ -0,0 +1,136 @@
+import argparse
+import io
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from feature_vector import max_value, numeric_columns, numeric_positions, region_position
+from inference_pool import predict_rows
+from property_dataset import region_column
+
+# Input columns of jordan_properties.csv used by the model; the price column is optional
+required_columns = numeric_columns + [region_column]
+price_column = 'السعر_المقدر_دينار'
+lower_column = 'الحد_الأدنى_دينار'
+upper_column = 'الحد_الأعلى_دينار'
+error_column = 'خطأ'
+
+
+# ═══════════════════════════════════════
+# Reading and Validation
+# ═══════════════════════════════════════
+def read_table(source, name=None):
+    # CSV or Parquet, from a path or an uploaded file object
+    name = name or getattr(source, 'name', None) or str(source)
+    if name.lower().endswith(('.parquet', '.pq')):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+def encode_table(df, encoder):
+    # Whole-table validation and encoding column by column into the
+    # encoder's batch buffer; returns the feature matrix and a per-row error
+    # message ('' when valid)
+    missing = [column for column in required_columns if column not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {missing}")
+
+    errors = pd.Series('', index=df.index, dtype=object)
+    X = encoder.buffer(len(df))
+    for position, column in zip(numeric_positions, numeric_columns):
+        values = pd.to_numeric(df[column], errors='coerce')
+        invalid = values.isna() | (values < 0) | (values > max_value)
+        errors[invalid & (errors == '')] = f"invalid {column}"
+        # Invalid cells are zeroed, not cast: values above float32 range would become inf
+        X[:, position] = values.mask(invalid, 0).to_numpy(dtype=np.float32)
+
+    # Region names resolve once per distinct value through the encoder's lookup
+    names = df[region_column].astype(str)
+    codes = names.map({name: encoder.region_code(name) for name in names.unique()})
+    errors[codes.isna() & (errors == '')] = "unknown region"
+    X[:, region_position] = codes.fillna(0).to_numpy(dtype=np.float32)
+    return X, errors
+
+
+# ═══════════════════════════════════════
+# Chunked Valuation
+# ═══════════════════════════════════════
+def predict_chunks(model, X, chunk_size=50_000, progress=None):
+    # Predictions (and a 10th-90th percentile band for forests) chunk by chunk;
+    # progress(done_rows, total_rows) is called after every chunk
+    price = np.empty(len(X))
+    lower = np.full(len(X), np.nan)
+    upper = np.full(len(X), np.nan)
+    for start in range(0, len(X), chunk_size):
+        chunk = X[start:start + chunk_size]
+        stop = start + len(chunk)
+        chunk_price, chunk_lower, chunk_upper = predict_rows(model, chunk)
+        price[start:stop] = chunk_price
+        if chunk_lower is not None:
+            lower[start:stop], upper[start:stop] = chunk_lower, chunk_upper
+        if progress:
+            progress(stop, len(X))
+    return price, lower, upper
+
+
+def value_table(df, artifact, chunk_size=50_000, progress=None):
+    # The input rows with the estimated price, its band and any validation error
+    X, errors = encode_table(df, artifact.feature_encoder)
+    valid = (errors == '').to_numpy()
+
+    results = df.copy()
+    results[price_column] = np.nan
+    results[lower_column] = np.nan
+    results[upper_column] = np.nan
+    if valid.any():
+        price, lower, upper = predict_chunks(artifact.model, X[valid], chunk_size, progress)
+        results.loc[valid, price_column] = price.round()
+        results.loc[valid, lower_column] = lower.round()
+        results.loc[valid, upper_column] = upper.round()
+    if not valid.all():
+        results[error_column] = errors
+    return results
+
+
+def to_file_bytes(results, file_format='csv'):
+    buffer = io.BytesIO()
+    if file_format == 'parquet':
+        results.to_parquet(buffer, index=False)
+    else:
+        # BOM so spreadsheet programs detect UTF-8 and show the Arabic text
+        results.to_csv(buffer, index=False, encoding='utf-8-sig')
+    return buffer.getvalue()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Value every property of a CSV or Parquet file')
+    parser.add_argument('input', help='CSV or Parquet file with the columns of jordan_properties.csv')
+    parser.add_argument('--output', default=None, help='Results file (.csv or .parquet)')
+    parser.add_argument('--chunk-size', type=int, default=50_000, help='Rows predicted at a time')
+    args = parser.parse_args(argv)
+
+    from model_artifact import serving_path
+    from model_registry import active_version, load_serving_artifact, version_path
+
+    version = active_version()
+    artifact = load_serving_artifact(version_path(version) if version else serving_path)
+
+    df = read_table(args.input)
+    start = time.perf_counter()
+    results = value_table(df, artifact, args.chunk_size,
+                          progress=lambda done, total: print(f"   {done:,}/{total:,} rows", end='\r'))
+    seconds = time.perf_counter() - start
+
+    output = args.output or os.path.splitext(args.input)[0] + '_valued.csv'
+    with open(output, 'wb') as f:
+        f.write(to_file_bytes(results, 'parquet' if output.endswith(('.parquet', '.pq')) else 'csv'))
+    invalid = int((results.get(error_column, pd.Series(dtype=object)).fillna('') != '').sum())
+    print(f"\nValued {len(results) - invalid:,} rows in {seconds:.1f}s "
+          f"({len(results) / max(seconds, 1e-9) * 60:,.0f} rows/min), {invalid:,} invalid")
+    print(f"Results saved to: {output}")
+
+
+if __name__ == '__main__':
+    main()
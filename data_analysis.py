@@ -1,14 +1,15 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from property_dataset import load_properties
+
 # Configure matplotlib to support Arabic text in visualizations
 plt.rcParams['font.family'] = 'Arial'
 plt.rcParams['axes.unicode_minus'] = False
 
 # Load the dataset
-print("Loading data from CSV file...")
-df = pd.read_csv('jordan_properties.csv')
+print("Loading dataset...")
+df = load_properties()
 
 print("Data loaded successfully!\n")
 
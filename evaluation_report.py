@@ -0,0 +1,41 @@
+import json
+import os
+import time
+
+import pandas as pd
+
+# Machine-readable evaluation written by price_properties_model.py and read
+# back by plot_evaluation.py; importing this module never loads a plotting library
+evaluation_dir = 'evaluation'
+report_file = 'report.json'
+predictions_file = 'predictions.csv'
+
+
+def feature_importances(models, features):
+    # Impurity-based importances of the models that expose them
+    return {name: {feature: float(value) for feature, value in zip(features, model.feature_importances_)}
+            for name, model in models.items() if hasattr(model, 'feature_importances_')}
+
+
+def write_evaluation(report, y_test, predictions, path=evaluation_dir, intervals=None):
+    os.makedirs(path, exist_ok=True)
+    report = dict(report, created_at=time.strftime('%Y-%m-%dT%H:%M:%S'), predictions_file=predictions_file)
+    with open(os.path.join(path, report_file), 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    # Test-set predictions of every candidate, indexed by dataset row
+    frame = pd.DataFrame({'actual': y_test, **{name: prediction for name, prediction in predictions.items()}},
+                         index=y_test.index)
+    # Prediction bands, e.g. 'Random Forest lower' / 'Random Forest upper'
+    for name, band in (intervals or {}).items():
+        frame[f"{name} lower"] = band['lower'].to_numpy()
+        frame[f"{name} upper"] = band['upper'].to_numpy()
+    frame.to_csv(os.path.join(path, predictions_file), index_label='row')
+    return report
+
+
+def read_evaluation(path=evaluation_dir):
+    with open(os.path.join(path, report_file), encoding='utf-8') as f:
+        report = json.load(f)
+    predictions = pd.read_csv(os.path.join(path, predictions_file), index_col=0)
+    return report, predictions
@@ -0,0 +1,74 @@
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs, parallel_config
+from sklearn.metrics import r2_score
+from threadpoolctl import threadpool_limits
+
+# Permutation importances already computed, keyed by model, data and settings
+cache_dir = os.path.join('.cache', 'permutation_importance')
+
+
+# ═══════════════════════════════════════
+# Permutation Importance
+# ═══════════════════════════════════════
+def _permuted_scores(model, X, y, columns, tasks, seed):
+    # One private copy of the test matrix per worker: each task shuffles one
+    # column in place, scores the model and puts the column back
+    buffer = np.array(X)
+    scores = []
+    with threadpool_limits(limits=1), parallel_config(backend='sequential'):
+        for feature, repeat in tasks:
+            original = buffer[:, feature].copy()
+            # Seeded per (feature, repeat): results do not depend on the worker count
+            order = np.random.default_rng([seed, feature, repeat]).permutation(len(buffer))
+            buffer[:, feature] = original[order]
+            prediction = model.predict(pd.DataFrame(buffer, columns=columns, copy=False))
+            scores.append((feature, repeat, r2_score(y, prediction)))
+            buffer[:, feature] = original
+    return scores
+
+
+def permutation_importances(model, X_test, y_test, n_repeats=5, seed=42, n_jobs=-1):
+    # Mean and std of the R² drop when a feature's test values are shuffled
+    columns = list(X_test.columns)
+    X = np.ascontiguousarray(X_test, dtype=np.float64)
+    y = np.asarray(y_test, dtype=np.float64)
+    baseline = r2_score(y, model.predict(X_test))
+
+    tasks = [(feature, repeat) for feature in range(len(columns)) for repeat in range(n_repeats)]
+    n_workers = max(1, min(effective_n_jobs(n_jobs), len(tasks)))
+    batches = [tasks[worker::n_workers] for worker in range(n_workers)]
+    results = Parallel(n_jobs=n_workers)(
+        delayed(_permuted_scores)(model, X, y, columns, batch, seed) for batch in batches)
+
+    drops = np.empty((len(columns), n_repeats))
+    for batch in results:
+        for feature, repeat, score in batch:
+            drops[feature, repeat] = baseline - score
+    return {column: {'mean': float(drops[i].mean()), 'std': float(drops[i].std())}
+            for i, column in enumerate(columns)}
+
+
+def importance_key(model, X_test, y_test, n_repeats, seed):
+    # Content hash of the fitted model, the test data and the settings
+    return joblib.hash((model, np.asarray(X_test), list(X_test.columns), np.asarray(y_test), n_repeats, seed))
+
+
+def cached_permutation_importances(model, X_test, y_test, n_repeats=5, seed=42, n_jobs=-1, path=cache_dir):
+    # Returns (importances, cache_hit)
+    cache_file = os.path.join(path, importance_key(model, X_test, y_test, n_repeats, seed) + '.json')
+    if os.path.exists(cache_file):
+        with open(cache_file, encoding='utf-8') as f:
+            return json.load(f), True
+
+    importances = permutation_importances(model, X_test, y_test, n_repeats, seed, n_jobs)
+    os.makedirs(path, exist_ok=True)
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(importances, f, ensure_ascii=False)
+    os.replace(tmp_file, cache_file)
+    return importances, False
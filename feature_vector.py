@@ -0,0 +1,84 @@
+import numpy as np
+
+from property_dataset import features, region_code_column, region_column
+
+# Numeric model inputs (every feature but the region code), in training order
+numeric_columns = [feature for feature in features if feature != region_code_column]
+numeric_positions = [features.index(column) for column in numeric_columns]
+region_position = features.index(region_code_column)
+# Largest input the float32 buffers hold; anything above would be stored as inf
+max_value = float(np.finfo(np.float32).max)
+
+
+# ═══════════════════════════════════════
+# Feature Vector Builder
+# ═══════════════════════════════════════
+class FeatureEncoder:
+    # Writes model inputs straight into float32 row or batch buffers, in the
+    # training feature order, without building a DataFrame. Regions resolve
+    # with one dict lookup, by Arabic name as stored or English name
+    # (case-insensitive), to the LabelEncoder's codes.
+
+    def __init__(self, label_encoder, regions_en=None):
+        self.codes = {region: code for code, region in enumerate(label_encoder.classes_)}
+        self.english = {name.strip().lower(): self.codes[region]
+                        for region, name in (regions_en or {}).items() if region in self.codes}
+        self.n_features = len(features)
+
+    def region_code(self, region):
+        # None for an unknown region
+        region = str(region).strip()
+        code = self.codes.get(region)
+        return self.english.get(region.lower()) if code is None else code
+
+    def buffer(self, n_rows=None):
+        shape = self.n_features if n_rows is None else (n_rows, self.n_features)
+        return np.empty(shape, dtype=np.float32)
+
+    def encode_row(self, values, region, out=None):
+        # `values` are the numeric inputs in `numeric_columns` order
+        code = self.region_code(region)
+        if code is None:
+            raise ValueError("unknown region")
+        out = self.buffer() if out is None else out
+        out[:region_position] = values
+        out[region_position] = code
+        return out
+
+    def encode_record(self, record, out=None):
+        # One property given as a mapping with the columns of jordan_properties.csv;
+        # raises ValueError with the same messages bulk validation reports per row
+        missing = [column for column in numeric_columns + [region_column] if column not in record]
+        if missing:
+            raise ValueError(f"Missing fields: {missing}")
+        out = self.buffer() if out is None else out
+        for position, column in zip(numeric_positions, numeric_columns):
+            value = record[column]
+            try:
+                value = float(value)
+            except (TypeError, ValueError, OverflowError):
+                raise ValueError(f"invalid {column}")
+            if not 0 <= value <= max_value:
+                raise ValueError(f"invalid {column}")
+            out[position] = value
+        code = self.region_code(record[region_column])
+        if code is None:
+            raise ValueError("unknown region")
+        out[region_position] = code
+        return out
+
+    def encode_records(self, records, out=None):
+        # Batch of mappings -> (rows, per-row error message, '' when valid);
+        # invalid rows are left zeroed in the buffer
+        out = self.buffer(len(records)) if out is None else out[:len(records)]
+        errors = []
+        for i, record in enumerate(records):
+            try:
+                if not isinstance(record, dict):
+                    raise ValueError("expected an object")
+                self.encode_record(record, out[i])
+                errors.append('')
+            except ValueError as exc:
+                out[i] = 0
+                errors.append(str(exc))
+        return out, errors
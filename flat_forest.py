@@ -0,0 +1,265 @@
+import argparse
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+
+from model_artifact import artifact_path, load_artifact, save_artifact
+
+
+# ═══════════════════════════════════════
+# Flat Forest Representation
+# ═══════════════════════════════════════
+class FlatForest:
+    # A regression forest stored as flat node arrays shared by all trees.
+    # children[2 * i] and children[2 * i + 1] are the left and right child
+    # of node i; leaves point to themselves, so every row can take exactly
+    # `depth` steps without checking whether it already reached a leaf.
+
+    def __init__(self, feature, threshold, children, value, roots, depth, n_features):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.value = value
+        self.roots = roots
+        self.depth = depth
+        self.n_features = n_features
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in (self.feature, self.threshold, self.children, self.value, self.roots))
+
+    def _step(self, node, flat_rows, row_offset):
+        # One level down: child 2i on x <= threshold, 2i + 1 otherwise
+        go_right = flat_rows.take(row_offset + self.feature.take(node)) > self.threshold.take(node)
+        return self.children.take((node << 1) + go_right)
+
+    def apply(self, X, chunk_size=2_000):
+        # Leaf index of every (row, tree) pair, evaluated level by level on
+        # cache-sized chunks of rows
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        leaves = np.empty((len(X), self.n_trees), dtype=self.children.dtype)
+        for start in range(0, len(X), chunk_size):
+            rows = X[start:start + chunk_size]
+            row_offset = (np.arange(len(rows)) * self.n_features)[:, None]
+            node = np.broadcast_to(self.roots, (len(rows), self.n_trees)).copy()
+            for _ in range(self.depth):
+                node = self._step(node, rows.ravel(), row_offset)
+            leaves[start:start + chunk_size] = node
+        return leaves
+
+    def predict(self, X):
+        return self.value.take(self.apply(X)).mean(axis=1, dtype=np.float64)
+
+    def predict_interval(self, X, lower=10, upper=90):
+        # Mean and percentile band of the per-tree predictions, from one
+        # (rows x trees) matrix of leaf values
+        tree_values = self.value.take(self.apply(X))
+        low, high = np.percentile(tree_values, [lower, upper], axis=1)
+        return tree_values.mean(axis=1, dtype=np.float64), low, high
+
+    def tree_values_one(self, x):
+        # Hot path for one row: all trees advance together, one level per step
+        # (the step is inlined: a method call per level is measurable here)
+        x = np.asarray(x, dtype=np.float32)
+        feature, threshold, children = self.feature, self.threshold, self.children
+        node = self.roots
+        for _ in range(self.depth):
+            node = children.take((node << 1) + (x.take(feature.take(node)) > threshold.take(node)))
+        return self.value.take(node)
+
+    def predict_one(self, x):
+        return float(self.tree_values_one(x).mean(dtype=np.float64))
+
+    def predict_one_interval(self, x, lower=10, upper=90):
+        # Percentiles read off the sorted tree values with numpy's default
+        # linear interpolation; np.percentile's overhead would dominate here
+        tree_values = np.sort(self.tree_values_one(x)).astype(np.float64)
+        band = []
+        for q in (lower, upper):
+            position = q / 100 * (len(tree_values) - 1)
+            below = int(position)
+            above = min(below + 1, len(tree_values) - 1)
+            low, high, t = tree_values[below], tree_values[above], position - below
+            # np.percentile interpolates from the nearer end, so match it bit for bit
+            band.append(low + (high - low) * t if t < 0.5 else high - (high - low) * (1 - t))
+        return float(tree_values.mean()), float(band[0]), float(band[1])
+
+
+def _tree_levels(left, right, is_leaf):
+    # Node ids of each depth level, only following the children of internal nodes
+    levels = [np.array([0])]
+    while True:
+        parents = levels[-1][~is_leaf[levels[-1]]]
+        if not len(parents):
+            return levels
+        levels.append(np.concatenate([left[parents], right[parents]]))
+
+
+def _compact_tree(tree, max_depth=None, merge_tolerance=0.0):
+    left = tree.children_left
+    right = tree.children_right
+    value = tree.value[:, 0, 0]
+    is_leaf = left == -1
+
+    # Cap the depth: nodes on the last allowed level become leaves holding
+    # their own training mean, which sklearn already stores for every node
+    levels = _tree_levels(left, right, is_leaf)
+    if max_depth is not None and len(levels) > max_depth + 1:
+        is_leaf = is_leaf.copy()
+        is_leaf[levels[max_depth]] = True
+        levels = levels[:max_depth + 1]
+
+    # Merge, bottom-up, sibling leaves whose values differ by at most the
+    # tolerance; the parent's mean is the sample-weighted mean of both
+    if merge_tolerance > 0:
+        is_leaf = is_leaf.copy()
+        for level in reversed(levels[:-1]):
+            internal = level[~is_leaf[level]]
+            mergeable = (is_leaf[left[internal]] & is_leaf[right[internal]] &
+                         (np.abs(value[left[internal]] - value[right[internal]]) <= merge_tolerance))
+            is_leaf[internal[mergeable]] = True
+        levels = _tree_levels(left, right, is_leaf)
+
+    # Renumber the surviving nodes in breadth-first order
+    kept = np.concatenate(levels)
+    new_id = np.full(len(left), -1, dtype=np.int64)
+    new_id[kept] = np.arange(len(kept))
+    leaf = is_leaf[kept]
+    own = np.arange(len(kept))
+    return {
+        'feature': np.where(leaf, 0, tree.feature[kept]),
+        'threshold': np.where(leaf, 0.0, tree.threshold[kept]),
+        'left': np.where(leaf, own, new_id[left[kept]]),
+        'right': np.where(leaf, own, new_id[right[kept]]),
+        'value': value[kept],
+        'depth': len(levels) - 1,
+    }
+
+
+def _float32_thresholds(threshold):
+    # sklearn compares float32 features against float64 thresholds. Rounding
+    # a threshold down to the nearest float32 keeps every comparison identical.
+    narrow = threshold.astype(np.float32)
+    rounded_up = narrow.astype(np.float64) > threshold
+    narrow[rounded_up] = np.nextafter(narrow[rounded_up], np.float32(-np.inf))
+    return narrow
+
+
+def flatten_forest(model, max_depth=None, merge_tolerance=0.0, feature_dtype=np.uint8, value_dtype=np.float64):
+    # Without a depth cap or merging this reproduces model.predict exactly
+    # (up to the summation order of the tree outputs).
+    trees = [_compact_tree(estimator.tree_, max_depth, merge_tolerance) for estimator in model.estimators_]
+    sizes = np.array([len(tree['value']) for tree in trees])
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    index_dtype = np.int32 if 2 * sizes.sum() < np.iinfo(np.int32).max else np.int64
+
+    def stack(key, dtype, shift=False):
+        return np.concatenate([tree[key] + (offset if shift else 0)
+                               for tree, offset in zip(trees, offsets)]).astype(dtype)
+
+    return FlatForest(
+        feature=stack('feature', feature_dtype),
+        threshold=_float32_thresholds(stack('threshold', np.float64)),
+        children=np.column_stack([stack('left', index_dtype, shift=True),
+                                  stack('right', index_dtype, shift=True)]).ravel(),
+        value=stack('value', value_dtype),
+        roots=offsets.astype(index_dtype),
+        depth=max(tree['depth'] for tree in trees),
+        n_features=model.n_features_in_,
+    )
+
+
+def prediction_intervals(model, X, lower=10, upper=90):
+    # Batch predictions with a percentile band for a random forest or its
+    # flat copy; the forest is flattened once instead of looping over trees
+    if not isinstance(model, FlatForest):
+        model = flatten_forest(model)
+    prediction, low, high = model.predict_interval(X, lower, upper)
+    index = X.index if hasattr(X, 'index') else None
+    return pd.DataFrame({'prediction': prediction, 'lower': low, 'upper': high}, index=index)
+
+
+# ═══════════════════════════════════════
+# Compaction Report
+# ═══════════════════════════════════════
+def _metrics(y_true, prediction):
+    return {'MAE': float(mean_absolute_error(y_true, prediction)),
+            'RMSE': float(np.sqrt(mean_squared_error(y_true, prediction))),
+            'R2_Score': float(r2_score(y_true, prediction))}
+
+
+def compaction_report(model, compact, X_test, y_test):
+    full_metrics = _metrics(y_test, model.predict(X_test))
+    compact_metrics = _metrics(y_test, compact.predict(X_test))
+    return {
+        'full': dict(full_metrics, nodes=int(sum(e.tree_.node_count for e in model.estimators_)),
+                     bytes=len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))),
+        'compact': dict(compact_metrics, nodes=compact.n_nodes, bytes=compact.nbytes, depth=compact.depth),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compact the exported random forest into narrow flat arrays')
+    parser.add_argument('--artifact', default=artifact_path, help='Artifact holding the fitted random forest')
+    parser.add_argument('--output', default=artifact_path + '_compact', help='Directory of the compact artifact')
+    parser.add_argument('--max-depth', type=int, default=12, help='Depth cap applied to every tree')
+    parser.add_argument('--merge-tolerance', type=float, default=1000.0,
+                        help='Merge sibling leaves whose predictions differ by at most this many JOD')
+    args = parser.parse_args(argv)
+
+    # Imported here: the training module imports this one (for prediction
+    # intervals), so a module-level import would be circular. FlatForest
+    # comes from the importable module (not __main__) so the pickled
+    # artifact loads in the web app.
+    from flat_forest import flatten_forest
+    from price_properties_model import prepare_data
+    from property_dataset import load_properties
+
+    artifact = load_artifact(args.artifact, mmap=False)
+    if not hasattr(artifact.model, 'estimators_') or artifact.model_name != 'Random Forest':
+        parser.error(f"{args.artifact} holds a {artifact.model_name} model, not a Random Forest")
+
+    # Same held-out split the model was evaluated on
+    _, X, y = prepare_data(load_properties())
+    _, X_test, _, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    start = time.perf_counter()
+    compact = flatten_forest(artifact.model, args.max_depth, args.merge_tolerance, value_dtype=np.float32)
+    seconds = time.perf_counter() - start
+    report = compaction_report(artifact.model, compact, X_test, y_test)
+
+    print(f"Compacted {compact.n_trees} trees in {seconds:.2f}s")
+    for label, key in [('Full forest', 'full'), ('Compact forest', 'compact')]:
+        entry = report[key]
+        print(f"\n{label}:")
+        print(f"   Nodes: {entry['nodes']:,}")
+        print(f"   Size: {entry['bytes'] / 1e6:,.2f} MB")
+        print(f"   MAE: {entry['MAE']:,.0f} JOD")
+        print(f"   R² Score: {entry['R2_Score']:.4f}")
+    print(f"\nR² change: {report['compact']['R2_Score'] - report['full']['R2_Score']:+.4f}")
+
+    metadata = dict(artifact.metadata,
+                    model_name='Random Forest (compact)',
+                    metrics={key: report['compact'][key] for key in ('MAE', 'RMSE', 'R2_Score')},
+                    compaction={'source_version': artifact.version, 'max_depth': args.max_depth,
+                                'merge_tolerance': args.merge_tolerance, 'report': report})
+    metadata.pop('linear_stats', None)
+    compact_artifact = save_artifact(compact, artifact.label_encoder, metadata, args.output, artifact.region_index)
+    print(f"\nCompact artifact saved to: {args.output} (version {compact_artifact.version})")
+    print(f"Serve it with: PRICE_MODEL_ARTIFACT={args.output} streamlit run web_app.py")
+
+
+if __name__ == '__main__':
+    main()
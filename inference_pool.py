@@ -0,0 +1,176 @@
+import argparse
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from flat_forest import FlatForest
+from property_dataset import features
+
+
+def predict_rows(model, X):
+    # Predictions and, for forests, the 10th-90th percentile band. X holds
+    # float32 rows in training order; load_serving_artifact() makes every
+    # served model take them without a DataFrame.
+    if isinstance(model, FlatForest):
+        if len(X) == 1:
+            # A lone row (the usual drained batch at low load): the per-row
+            # walk skips the chunked apply and np.percentile
+            price, lower, upper = model.predict_one_interval(X[0])
+            return np.array([price]), np.array([lower]), np.array([upper])
+        return model.predict_interval(X)
+    return model.predict(X), None, None
+
+
+# ═══════════════════════════════════════
+# Shared Inference Worker Pool
+# ═══════════════════════════════════════
+class InferencePool:
+    # Sessions submit single rows and get a Future back. A few worker threads
+    # drain the shared queue and answer up to `max_batch` waiting requests
+    # with one vectorized predict call. By default a worker takes only what is
+    # already queued (max_wait=0): a lone request is not delayed, and under
+    # load the queue fills while the previous batch is being predicted.
+    # Every request carries the artifact snapshot of its session, so a batch
+    # spanning a model swap is split per model.
+
+    def __init__(self, n_workers=2, max_batch=64, max_wait=0.0):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.batches = 0
+        self.rows = 0
+        self.max_batch_seen = 0
+        self.max_queue_depth = 0
+        self._workers = [threading.Thread(target=self._work, name=f'inference-worker-{i}', daemon=True)
+                         for i in range(n_workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, artifact, row):
+        # Future resolving to (price, lower, upper); lower/upper are None for non-forest models
+        future = Future()
+        self._queue.put((artifact, row, future))
+        with self._lock:
+            self.submitted += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return future
+
+    def predict(self, artifact, row, timeout=30.0):
+        return self.submit(artifact, row).result(timeout)
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _work(self):
+        # Each worker copies its batch's rows into its own preallocated buffer
+        buffer = np.empty((self.max_batch, len(features)), dtype=np.float32)
+        while True:
+            batch = self._next_batch()
+            by_model = {}
+            for item in batch:
+                by_model.setdefault(id(item[0]), []).append(item)
+            for items in by_model.values():
+                self._run(items, buffer)
+
+    def _run(self, items, buffer):
+        model = items[0][0].model
+        X = buffer[:len(items)]
+        try:
+            for i, (_, row, _) in enumerate(items):
+                X[i] = row
+            price, lower, upper = predict_rows(model, X)
+        except Exception as exc:
+            for _, _, future in items:
+                future.set_exception(exc)
+            return
+        with self._lock:
+            self.batches += 1
+            self.rows += len(items)
+            self.max_batch_seen = max(self.max_batch_seen, len(items))
+        for i, (_, _, future) in enumerate(items):
+            future.set_result((float(price[i]),
+                               None if lower is None else float(lower[i]),
+                               None if upper is None else float(upper[i])))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'queue_depth': self._queue.qsize(),
+                'max_queue_depth': self.max_queue_depth,
+                'submitted': self.submitted,
+                'batches': self.batches,
+                'mean_batch_size': self.rows / self.batches if self.batches else 0.0,
+                'max_batch_size': self.max_batch_seen,
+            }
+
+
+# ═══════════════════════════════════════
+# Concurrency Benchmark
+# ═══════════════════════════════════════
+def concurrent_latency(predict, rows, n_threads, requests_per_thread=200):
+    # p50/p99 latency (ms) of `n_threads` sessions each predicting one row at a time
+    latencies = [[] for _ in range(n_threads)]
+    start_barrier = threading.Barrier(n_threads)
+
+    def session(index):
+        start_barrier.wait()
+        for i in range(requests_per_thread):
+            start = time.perf_counter()
+            predict(rows[(index * requests_per_thread + i) % len(rows)])
+            latencies[index].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(n_threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    latency_ms = np.concatenate(latencies) * 1000
+    return {'p50_ms': float(np.percentile(latency_ms, 50)), 'p99_ms': float(np.percentile(latency_ms, 99)),
+            'per_second': len(latency_ms) / seconds}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare per-session predict calls with the shared worker pool')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 16, 64], help='Concurrent sessions')
+    parser.add_argument('--requests', type=int, default=200, help='Predictions per session')
+    parser.add_argument('--workers', type=int, default=2, help='Pool worker threads')
+    args = parser.parse_args(argv)
+
+    from bulk_valuation import encode_table
+    from generate_jordan_data import generate_properties
+    from model_artifact import serving_path
+    from model_registry import ActiveModel
+
+    artifact = ActiveModel(fallback_path=serving_path).current
+    rows, _ = encode_table(generate_properties(10_000, seed=1), artifact.feature_encoder)
+    pool = InferencePool(n_workers=args.workers)
+
+    def direct(row):
+        return predict_rows(artifact.model, row[None, :])
+
+    print(f"Model: {artifact.model_name} ({artifact.version})")
+    for n_threads in args.threads:
+        for label, predict in [('direct', direct), ('pool', lambda row: pool.predict(artifact, row))]:
+            result = concurrent_latency(predict, rows, n_threads, args.requests)
+            print(f"   {n_threads:>3} sessions, {label:<6}: p50 {result['p50_ms']:7.2f} ms, "
+                  f"p99 {result['p99_ms']:7.2f} ms, {result['per_second']:8,.0f} predictions/s")
+    print(f"Pool: {pool.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+
+# Default location of the exported serving model
+artifact_path = os.path.join('models', 'price_model')
+# Artifact the web app serves, e.g. a compacted copy of the exported model
+serving_path = os.environ.get('PRICE_MODEL_ARTIFACT', artifact_path)
+
+format_version = 1
+model_file = 'model.joblib'
+encoder_file = 'label_encoder.joblib'
+metadata_file = 'metadata.json'
+region_index_file = 'region_index.npz'
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ModelArtifact:
+    # Fitted model + label encoder + the metadata written next to them,
+    # and the per-region price index when the artifact has one
+
+    def __init__(self, model, label_encoder, metadata, region_index=None):
+        self.model = model
+        self.label_encoder = label_encoder
+        self.metadata = metadata
+        self.region_index = region_index
+        self._feature_encoder = None
+
+    @property
+    def version(self):
+        return self.metadata['version']
+
+    @property
+    def model_name(self):
+        return self.metadata['model_name']
+
+    @property
+    def features(self):
+        return self.metadata['features']
+
+    @property
+    def regions_ar(self):
+        return self.metadata['regions']['regions_ar']
+
+    @property
+    def regions_en(self):
+        return self.metadata['regions']['regions_en']
+
+    @property
+    def region_avg(self):
+        return self.metadata['regions']['avg_price']
+
+    @property
+    def feature_encoder(self):
+        # Built on first use; an artifact's regions never change
+        if self._feature_encoder is None:
+            from feature_vector import FeatureEncoder
+            self._feature_encoder = FeatureEncoder(self.label_encoder, self.regions_en)
+        return self._feature_encoder
+
+
+def save_artifact(model, label_encoder, metadata, path=artifact_path, region_index=None):
+    # Write into a temporary directory first so a crash never leaves a
+    # half-written artifact at `path`.
+    import joblib
+
+    tmp_path = path + '.tmp'
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    # Uncompressed so the numpy buffers can be memory-mapped on load
+    joblib.dump(model, os.path.join(tmp_path, model_file))
+    joblib.dump(label_encoder, os.path.join(tmp_path, encoder_file))
+    if region_index is not None:
+        region_index.save(os.path.join(tmp_path, region_index_file))
+
+    model_sha256 = _file_sha256(os.path.join(tmp_path, model_file))
+    created_at = time.strftime('%Y-%m-%dT%H:%M:%S')
+    metadata = dict(metadata,
+                    format_version=format_version,
+                    version=f"{time.strftime('%Y%m%d%H%M%S')}-{model_sha256[:8]}",
+                    created_at=created_at,
+                    model_sha256=model_sha256)
+
+    with open(os.path.join(tmp_path, metadata_file), 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    os.replace(tmp_path, path)
+    return ModelArtifact(model, label_encoder, metadata, region_index)
+
+
+def read_metadata(path=artifact_path):
+    with open(os.path.join(path, metadata_file), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_artifact(path=artifact_path, mmap=True, verify=True):
+    # joblib and numpy are imported on first load: reading metadata (e.g. the
+    # web app's first render) only needs this module's light top level
+    import joblib
+    from region_stats import RegionIndex
+
+    metadata = read_metadata(path)
+    if metadata.get('format_version') != format_version:
+        raise ValueError(f"Unsupported model artifact format {metadata.get('format_version')!r} in {path}")
+
+    # The checksum ties the served model to the one that was evaluated
+    model_path = os.path.join(path, model_file)
+    if verify and _file_sha256(model_path) != metadata['model_sha256']:
+        raise ValueError(f"{model_path} does not match the evaluated model recorded in {metadata_file}")
+
+    model = joblib.load(model_path, mmap_mode='r' if mmap else None)
+    label_encoder = joblib.load(os.path.join(path, encoder_file))
+    index_path = os.path.join(path, region_index_file)
+    region_index = RegionIndex.load(index_path) if os.path.exists(index_path) else None
+    return ModelArtifact(model, label_encoder, metadata, region_index)
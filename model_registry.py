@@ -0,0 +1,222 @@
+import argparse
+import copy
+import os
+import shutil
+import threading
+import time
+
+from model_artifact import ModelArtifact, load_artifact, metadata_file, read_metadata
+
+# Registered artifacts live in versions/<version>/; the file `active` names
+# the version being served and is only ever replaced atomically
+registry_path = os.path.join('models', 'registry')
+versions_dir = 'versions'
+active_file = 'active'
+
+
+# ═══════════════════════════════════════
+# File-Based Registry
+# ═══════════════════════════════════════
+def version_path(version, registry=registry_path):
+    return os.path.join(registry, versions_dir, version)
+
+
+def register(source, registry=registry_path, activate=False):
+    # Copy an exported artifact into the registry under its own version
+    version = read_metadata(source)['version']
+    path = version_path(version, registry)
+    if not os.path.exists(path):
+        tmp_path = path + '.tmp'
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        shutil.copytree(source, tmp_path)
+        os.replace(tmp_path, path)
+    if activate:
+        set_active(version, registry)
+    return version
+
+
+def set_active(version, registry=registry_path):
+    if not os.path.exists(os.path.join(version_path(version, registry), metadata_file)):
+        raise ValueError(f"Version {version} is not registered in {registry}")
+    # Readers see either the old or the new pointer, never a partial write
+    tmp_file = os.path.join(registry, active_file + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(tmp_file, os.path.join(registry, active_file))
+
+
+def active_version(registry=registry_path):
+    try:
+        with open(os.path.join(registry, active_file), encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def list_versions(registry=registry_path):
+    root = os.path.join(registry, versions_dir)
+    if not os.path.isdir(root):
+        return []
+    active = active_version(registry)
+    versions = []
+    for version in sorted(os.listdir(root)):
+        if version.endswith('.tmp'):
+            continue
+        metadata = read_metadata(version_path(version, registry))
+        versions.append({
+            'version': version,
+            'active': version == active,
+            'model_name': metadata['model_name'],
+            'created_at': metadata['created_at'],
+            'metrics': metadata['metrics'],
+            'train_seconds': metadata.get('train_seconds'),
+            'data': {'rows': metadata['data']['rows'], 'fingerprint': metadata['data']['fingerprint']},
+        })
+    return versions
+
+
+# ═══════════════════════════════════════
+# Background Hot-Swap
+# ═══════════════════════════════════════
+def load_serving_artifact(path):
+    # Artifact ready to serve: random forests are flattened for the
+    # single-row hot path, and one prediction warms up the new model.
+    # sklearn is imported here, not at module level, so the registry helpers
+    # stay cheap to import for callers that only read pointers and metadata.
+    from sklearn.ensemble import RandomForestRegressor
+
+    from flat_forest import flatten_forest
+    from property_dataset import features
+
+    artifact = load_artifact(path)
+    model = artifact.model
+    if isinstance(model, RandomForestRegressor):
+        model = flatten_forest(model)
+    elif hasattr(model, 'feature_names_in_'):
+        # Served rows are float32 arrays in training order and reach sklearn
+        # as they are, not as a DataFrame built per request; the order is
+        # checked once here, and the served copy forgets the column names so
+        # sklearn does not warn about their absence on every call
+        if list(model.feature_names_in_) != features:
+            raise ValueError(f"{path} was fitted on columns {list(model.feature_names_in_)}, not {features}")
+        model = copy.copy(model)
+        del model.feature_names_in_
+    artifact = ModelArtifact(model, artifact.label_encoder, artifact.metadata, artifact.region_index)
+    warm_up(artifact)
+    return artifact
+
+
+def warm_up(artifact):
+    # Also builds the artifact's feature encoder before it is served
+    from inference_pool import predict_rows
+
+    row = artifact.feature_encoder.buffer(1)
+    row[:] = 0
+    predict_rows(artifact.model, row)
+
+
+class ActiveModel:
+    # The served artifact, replaced in the background whenever the registry's
+    # active pointer changes. `current` is swapped in one assignment after the
+    # new model is fully loaded and warmed up, so a request that reads it once
+    # always gets a complete model. With background=True the first load also
+    # runs on the watcher thread: `current` stays None until it is done, and
+    # wait() blocks until then.
+
+    def __init__(self, registry=registry_path, fallback_path=None, interval=2.0, loader=load_serving_artifact,
+                 background=False):
+        self.registry = registry
+        self.fallback_path = fallback_path
+        self.interval = interval
+        self.loader = loader
+        self.error = None
+        self.current = None
+        self.load_seconds = None
+        self._ready = threading.Event()
+
+        if not background:
+            self._load_initial()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._watch, name='model-registry-watcher', daemon=True)
+        self._thread.start()
+
+    def _load_initial(self):
+        start = time.perf_counter()
+        try:
+            version = active_version(self.registry)
+            self.current = self.loader(version_path(version, self.registry) if version else self.fallback_path)
+            self.load_seconds = time.perf_counter() - start
+        except Exception as exc:
+            self.error = str(exc)
+            raise
+        finally:
+            self._ready.set()
+
+    def wait(self, timeout=None):
+        # The served artifact, once the initial load has finished
+        if not self._ready.wait(timeout):
+            raise TimeoutError(f"Model not loaded after {timeout}s")
+        if self.current is None:
+            raise RuntimeError(f"Model failed to load: {self.error}")
+        return self.current
+
+    def _watch(self):
+        if self.current is None:
+            try:
+                self._load_initial()
+            except Exception as exc:
+                print(f"Model load failed: {exc}")
+        while not self._stop.wait(self.interval):
+            version = active_version(self.registry)
+            if version is None or (self.current is not None and version == self.current.version):
+                continue
+            try:
+                artifact = self.loader(version_path(version, self.registry))
+            except Exception as exc:
+                # Keep serving the previous model; retried on the next poll
+                self.error = f"{version}: {exc}"
+                print(f"Model swap to {version} failed: {exc}")
+                continue
+            self.current = artifact
+            self.error = None
+            print(f"Now serving model version {version}")
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manage the local model registry')
+    parser.add_argument('--registry', default=registry_path, help='Registry directory')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    register_parser = subparsers.add_parser('register', help='Add an exported artifact to the registry')
+    register_parser.add_argument('artifact', help='Artifact directory (e.g. models/price_model)')
+    register_parser.add_argument('--activate', action='store_true', help='Also make it the served version')
+
+    activate_parser = subparsers.add_parser('activate', help='Serve a registered version')
+    activate_parser.add_argument('version', help='Registered version')
+
+    subparsers.add_parser('list', help='Show the registered versions')
+    args = parser.parse_args(argv)
+
+    if args.command == 'register':
+        version = register(args.artifact, args.registry, args.activate)
+        print(f"Registered version {version}" + (" (active)" if args.activate else ""))
+    elif args.command == 'activate':
+        set_active(args.version, args.registry)
+        print(f"Active version: {args.version}")
+    else:
+        versions = list_versions(args.registry)
+        if not versions:
+            print(f"No registered versions in {args.registry}")
+        for entry in versions:
+            marker = '*' if entry['active'] else ' '
+            print(f"{marker} {entry['version']}  {entry['model_name']:<24} R² {entry['metrics']['R2_Score']:.4f}  "
+                  f"{entry['data']['rows']:,} rows  created {entry['created_at']}" +
+                  (f"  trained in {entry['train_seconds']:.1f}s" if entry['train_seconds'] is not None else ""))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingRandomSearchCV, KFold
+
+# Parameter space, budget resource and its maximum for every tunable candidate.
+# The budget grows with the number of trees/iterations, so every round sees
+# the full training set and the same cached folds.
+search_spaces = {
+    'Random Forest': ({
+        'max_depth': [None, 10, 20, 30],
+        'min_samples_leaf': [1, 2, 4, 8],
+        'max_features': [1.0, 0.7, 0.5, 'sqrt'],
+    }, 'n_estimators', 300),
+    'Gradient Boosting': ({
+        'learning_rate': [0.03, 0.05, 0.1, 0.2],
+        'max_depth': [2, 3, 4, 5],
+        'min_samples_leaf': [1, 5, 20],
+        'subsample': [0.8, 1.0],
+    }, 'n_estimators', 600),
+    'Hist Gradient Boosting': ({
+        'learning_rate': [0.03, 0.05, 0.1, 0.2],
+        'max_leaf_nodes': [15, 31, 63],
+        'min_samples_leaf': [10, 20, 50],
+        'l2_regularization': [0.0, 0.1, 1.0],
+    }, 'max_iter', 900),
+}
+
+
+def cached_folds(n_samples, n_splits=5, seed=42):
+    # Fold indices computed once and shared by every candidate of every search
+    return list(KFold(n_splits=n_splits, shuffle=True, random_state=seed).split(np.empty((n_samples, 1))))
+
+
+def tune_model(name, model, X, y, folds, n_candidates=27, factor=3, seed=42):
+    space, resource, max_resources = search_spaces[name]
+    model = clone(model)
+    # Parallelism comes from running candidates x folds on all cores
+    if 'n_jobs' in model.get_params():
+        model.set_params(n_jobs=1)
+    if 'early_stopping' in model.get_params():
+        model.set_params(early_stopping=False)
+
+    search = HalvingRandomSearchCV(
+        model, space, n_candidates=n_candidates, factor=factor, resource=resource,
+        max_resources=max_resources, min_resources='exhaust', cv=folds, scoring='r2',
+        refit=False, n_jobs=-1, random_state=seed)
+
+    start = time.perf_counter()
+    search.fit(X, y)
+    elapsed = time.perf_counter() - start
+
+    # Seconds spent per candidate across all the rounds it survived
+    results = pd.DataFrame(search.cv_results_)
+    results['candidate'] = results['params'].map(
+        lambda params: ', '.join(f"{k}={v}" for k, v in sorted(params.items()) if k != resource))
+    results['seconds'] = (results['mean_fit_time'] + results['mean_score_time']) * len(folds)
+    report = results.groupby('candidate').agg(
+        rounds=('iter', 'size'),
+        resources=('n_resources', 'max'),
+        seconds=('seconds', 'sum'),
+        R2_Score=('mean_test_score', 'last'),
+    ).sort_values(['resources', 'R2_Score'], ascending=False)
+
+    params = dict(search.best_params_)
+    if 'early_stopping' in model.get_params():
+        params['early_stopping'] = False
+    return {'params': params, 'R2_Score': search.best_score_, 'seconds': elapsed, 'report': report}
+
+
+def tune_models(models, X_train, y_train, n_splits=5, n_candidates=27, factor=3, seed=42, verbose=True):
+    # One contiguous float32 matrix (what the tree models use internally) is
+    # shared by all searches instead of re-converting the DataFrame per fit
+    X = np.ascontiguousarray(X_train, dtype=np.float32)
+    y = np.asarray(y_train, dtype=np.float64)
+    folds = cached_folds(len(X), n_splits, seed)
+
+    tuned = {}
+    for name, model in models.items():
+        if name not in search_spaces:
+            continue
+        if verbose:
+            print(f"\nTuning {name} ({n_candidates} candidates, {n_splits}-fold CV, successive halving)...")
+        tuned[name] = result = tune_model(name, model, X, y, folds, n_candidates, factor, seed)
+        if verbose:
+            print(result['report'].head(10).to_string(formatters={'seconds': '{:.2f}'.format,
+                                                                  'R2_Score': '{:.4f}'.format}))
+            print(f"   Best CV R²: {result['R2_Score']:.4f} in {result['seconds']:.1f}s")
+            print(f"   Best parameters: {result['params']}")
+    return tuned
@@ -0,0 +1,223 @@
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import SGDRegressor
+from sklearn.neural_network import MLPRegressor
+from sklearn.preprocessing import StandardScaler
+
+from property_dataset import (csv_path, load_properties, features, target,
+                              region_column, region_code_column, regions_en)
+
+# Region vocabulary fixed up front, so every chunk gets the same codes
+# (sorted, i.e. the same codes LabelEncoder assigns on the full dataset)
+region_vocabulary = sorted(regions_en)
+numeric_features = [feature for feature in features if feature != region_code_column]
+
+
+# ═══════════════════════════════════════
+# Chunked Input and Hash Split
+# ═══════════════════════════════════════
+def iter_chunks(source, chunk_size):
+    # Chunks from a CSV file, or slices of a memory-mapped columnar directory
+    if os.path.isdir(source):
+        df = load_properties(source, source=None)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+    else:
+        yield from pd.read_csv(source, chunksize=chunk_size)
+
+
+def encode_chunk(chunk):
+    codes = pd.Categorical(chunk[region_column], categories=region_vocabulary).codes
+    if (codes < 0).any():
+        unknown = sorted(set(chunk[region_column][codes < 0]))
+        raise ValueError(f"Unknown regions in input: {unknown}")
+    X = np.column_stack([chunk[numeric_features].to_numpy(dtype=np.float64), codes])
+    return X, chunk[target].to_numpy(dtype=np.float64)
+
+
+def test_mask(chunk, test_percent=20):
+    # Deterministic train/test assignment from a hash of the row contents:
+    # no shuffle, and independent of chunk size and row order
+    # (canonical dtypes, so a CSV and its columnar copy split identically)
+    rows = chunk[numeric_features].astype(np.int64).assign(**{region_column: chunk[region_column].astype(str)})
+    hashes = pd.util.hash_pandas_object(rows, index=False)
+    return (hashes.to_numpy() % 100) < test_percent
+
+
+# ═══════════════════════════════════════
+# Streaming Metrics
+# ═══════════════════════════════════════
+class StreamingMetrics:
+    # MAE, RMSE and R² accumulated chunk by chunk (Chan's parallel variance
+    # update keeps the total sum of squares numerically stable)
+
+    def __init__(self):
+        self.n = 0
+        self.abs_error = 0.0
+        self.squared_error = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, y_true, y_pred):
+        n = len(y_true)
+        if n == 0:
+            return
+        errors = y_true - y_pred
+        self.abs_error += np.abs(errors).sum()
+        self.squared_error += np.square(errors).sum()
+
+        mean = y_true.mean()
+        m2 = np.square(y_true - mean).sum()
+        delta = mean - self.mean
+        total = self.n + n
+        self.m2 += m2 + delta ** 2 * self.n * n / total
+        self.mean += delta * n / total
+        self.n = total
+
+    def result(self):
+        return {
+            'MAE': self.abs_error / self.n,
+            'RMSE': np.sqrt(self.squared_error / self.n),
+            'R2_Score': 1 - self.squared_error / self.m2,
+        }
+
+
+# ═══════════════════════════════════════
+# Incrementally Fitted Models
+# ═══════════════════════════════════════
+class ScaledOnlineModel:
+    # partial_fit estimator on standardized numeric features, one-hot regions
+    # and a standardized target; scaling statistics come from a first pass
+
+    def __init__(self, estimator):
+        self.estimator = estimator
+        self.scaler = StandardScaler()
+        self.y_scaler = StandardScaler()
+
+    def partial_fit_scaling(self, X, y):
+        self.scaler.partial_fit(X[:, :-1])
+        self.y_scaler.partial_fit(y.reshape(-1, 1))
+
+    def _design(self, X):
+        regions = np.eye(len(region_vocabulary))[X[:, -1].astype(np.intp)]
+        return np.hstack([self.scaler.transform(X[:, :-1]), regions])
+
+    def partial_fit(self, X, y):
+        self.estimator.partial_fit(self._design(X), self.y_scaler.transform(y.reshape(-1, 1)).ravel())
+
+    def predict(self, X):
+        prediction = self.estimator.predict(self._design(X)).reshape(-1, 1)
+        return self.y_scaler.inverse_transform(prediction).ravel()
+
+
+class ChunkedForest:
+    # Random forest with a fixed budget of `n_trees`, spread evenly over the
+    # chunks (warm start), so each tree only ever sees one chunk of training
+    # rows. With more chunks than trees, evenly spaced chunks get one tree
+    # each and the rest are skipped. Each tree has at most
+    # chunk_size / min_samples_leaf leaves, so the model holds at most
+    # n_trees times that many nodes whatever the dataset size: peak memory is
+    # bounded by the chunk size, not by the number of chunks.
+
+    def __init__(self, n_trees=100, random_state=42):
+        self.n_trees = n_trees
+        self.model = RandomForestRegressor(n_estimators=0, warm_start=True, min_samples_leaf=5,
+                                           n_jobs=-1, random_state=random_state)
+        self.schedule = []
+        self.chunks_seen = 0
+
+    def plan(self, n_chunks):
+        # Trees for each of the `n_chunks` training chunks, summing to n_trees
+        self.schedule = np.diff(np.arange(n_chunks + 1) * self.n_trees // n_chunks)
+        self.chunks_seen = 0
+
+    def partial_fit(self, X, y):
+        trees = self.schedule[self.chunks_seen] if self.chunks_seen < len(self.schedule) else 0
+        self.chunks_seen += 1
+        if trees:
+            self.model.set_params(n_estimators=self.model.n_estimators + int(trees))
+            self.model.fit(X, y)
+
+    def predict(self, X):
+        return self.model.predict(X)
+
+
+def build_online_models(n_trees=100):
+    return {
+        'SGD Regressor': ScaledOnlineModel(SGDRegressor(alpha=1e-5, random_state=42)),
+        'MLP Regressor': ScaledOnlineModel(MLPRegressor(hidden_layer_sizes=(64, 32), random_state=42)),
+        'Random Forest (chunked)': ChunkedForest(n_trees),
+    }
+
+
+def train_out_of_core(source, chunk_size=100_000, epochs=3, test_percent=20, n_trees=100, verbose=True):
+    models = build_online_models(n_trees)
+    scaled = [model for model in models.values() if isinstance(model, ScaledOnlineModel)]
+    start = time.perf_counter()
+
+    # Pass 1: scaling statistics of the training rows
+    n_train = n_test = n_chunks = 0
+    for chunk in iter_chunks(source, chunk_size):
+        X, y = encode_chunk(chunk)
+        train = ~test_mask(chunk, test_percent)
+        n_train += train.sum()
+        n_test += (~train).sum()
+        n_chunks += 1
+        for model in scaled:
+            model.partial_fit_scaling(X[train], y[train])
+    models['Random Forest (chunked)'].plan(n_chunks)
+    if verbose:
+        print(f"Training rows: {n_train:,}, test rows: {n_test:,} (chunks of {chunk_size:,})")
+
+    # Training passes; the forest takes its trees in the first pass only
+    for epoch in range(epochs):
+        for chunk in iter_chunks(source, chunk_size):
+            X, y = encode_chunk(chunk)
+            train = ~test_mask(chunk, test_percent)
+            for model in models.values():
+                if epoch == 0 or isinstance(model, ScaledOnlineModel):
+                    model.partial_fit(X[train], y[train])
+        if verbose:
+            print(f"   Epoch {epoch + 1}/{epochs} done ({time.perf_counter() - start:.1f}s)")
+
+    # Evaluation pass over the hashed test rows
+    metrics = {name: StreamingMetrics() for name in models}
+    for chunk in iter_chunks(source, chunk_size):
+        X, y = encode_chunk(chunk)
+        test = test_mask(chunk, test_percent)
+        for name, model in models.items():
+            metrics[name].update(y[test], model.predict(X[test]))
+
+    return models, {name: metric.result() for name, metric in metrics.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Train price models on data larger than memory')
+    parser.add_argument('--source', default=csv_path, help='CSV file or columnar directory')
+    parser.add_argument('--chunk-size', type=int, default=100_000, help='Rows held in memory at a time')
+    parser.add_argument('--epochs', type=int, default=3, help='Passes of the online (partial_fit) models')
+    parser.add_argument('--test-percent', type=int, default=20, help='Share of rows hashed into the test set')
+    parser.add_argument('--trees', type=int, default=100,
+                        help='Total forest trees, spread over the chunks (bounds the model size)')
+    args = parser.parse_args(argv)
+
+    print("=" * 70)
+    print("Out-of-Core Training")
+    print("=" * 70)
+    models, results = train_out_of_core(args.source, args.chunk_size, args.epochs, args.test_percent,
+                                        args.trees)
+
+    for name, result in results.items():
+        print(f"\n{name}:")
+        print(f"   MAE: {result['MAE']:,.0f} JOD")
+        print(f"   RMSE: {result['RMSE']:,.0f} JOD")
+        print(f"   R² Score: {result['R2_Score']:.4f} ({result['R2_Score'] * 100:.2f}%)")
+
+
+if __name__ == '__main__':
+    main()
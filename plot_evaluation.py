@@ -0,0 +1,102 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from evaluation_report import evaluation_dir, read_evaluation
+
+
+# ═══════════════════════════════════════
+# Visualization
+# ═══════════════════════════════════════
+def plot_evaluation(path=evaluation_dir, output='model_evaluation.png', show=False):
+    report, predictions = read_evaluation(path)
+    results_df = pd.DataFrame(report['metrics'])
+    best_model_name = report['best_model']
+    y_test = predictions['actual']
+    best_pred = predictions[best_model_name]
+
+    fig = plt.figure(figsize=(16, 10))
+
+    # R² Score comparison
+    plt.subplot(2, 3, 1)
+    plt.bar(results_df['Model'], results_df['R2_Score'], color=['skyblue', 'lightgreen', 'coral', 'plum'])
+    plt.title('Model Comparison - R² Score', fontweight='bold', fontsize=12)
+    plt.ylabel('R² Score')
+    plt.ylim([0, 1])
+    plt.xticks(rotation=15, ha='right')
+    plt.grid(alpha=0.3, axis='y')
+
+    # MAE comparison
+    plt.subplot(2, 3, 2)
+    plt.bar(results_df['Model'], results_df['MAE'], color=['gold', 'lightblue', 'pink', 'khaki'])
+    plt.title('Model Comparison - MAE', fontweight='bold', fontsize=12)
+    plt.ylabel('MAE (JOD)')
+    plt.xticks(rotation=15, ha='right')
+    plt.grid(alpha=0.3, axis='y')
+
+    # Actual vs Predicted scatter plot
+    plt.subplot(2, 3, 3)
+    plt.scatter(y_test, best_pred, alpha=0.6, color='purple')
+    plt.plot([y_test.min(), y_test.max()], [y_test.min(), y_test.max()], 'r--', lw=2)
+    plt.title(f'Actual vs Predicted - {best_model_name}', fontweight='bold', fontsize=12)
+    plt.xlabel('Actual Price (JOD)')
+    plt.ylabel('Predicted Price (JOD)')
+    plt.grid(alpha=0.3)
+
+    # Error distribution
+    plt.subplot(2, 3, 4)
+    errors = y_test - best_pred
+    plt.hist(errors, bins=50, color='teal', edgecolor='black', alpha=0.7)
+    plt.title('Prediction Error Distribution', fontweight='bold', fontsize=12)
+    plt.xlabel('Error (JOD)')
+    plt.ylabel('Frequency')
+    plt.grid(alpha=0.3, axis='y')
+
+    # Feature importance chart (permutation importance for models without impurity importances)
+    importances = report['feature_importances'].get(best_model_name)
+    if not importances and best_model_name in report.get('permutation_importances', {}):
+        importances = {feature: value['mean']
+                       for feature, value in report['permutation_importances'][best_model_name].items()}
+    if importances:
+        plt.subplot(2, 3, 5)
+        top_features = pd.Series(importances).sort_values(ascending=False).head(10)
+        plt.barh(range(len(top_features)), top_features.values, color='orange', alpha=0.7)
+        plt.yticks(range(len(top_features)), top_features.index, fontsize=9)
+        plt.title('Top 10 Feature Importance', fontweight='bold', fontsize=12)
+        plt.xlabel('Importance')
+        plt.grid(alpha=0.3, axis='x')
+
+    # Percentage error distribution
+    plt.subplot(2, 3, 6)
+    percentage_error = np.abs((y_test - best_pred) / y_test) * 100
+    plt.hist(percentage_error, bins=50, color='salmon', edgecolor='black', alpha=0.7)
+    plt.title('Percentage Error Distribution', fontweight='bold', fontsize=12)
+    plt.xlabel('Error (%)')
+    plt.ylabel('Frequency')
+    plt.axvline(percentage_error.mean(), color='red', linestyle='--', linewidth=2,
+                label=f'Mean: {percentage_error.mean():.1f}%')
+    plt.legend()
+    plt.grid(alpha=0.3, axis='y')
+
+    plt.tight_layout()
+    plt.savefig(output, dpi=300, bbox_inches='tight')
+    print(f"Visualizations saved to: {output}")
+    if show:
+        plt.show()
+    plt.close(fig)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Plot a saved model evaluation')
+    parser.add_argument('--evaluation-dir', default=evaluation_dir,
+                        help='Directory written by price_properties_model.py')
+    parser.add_argument('--output', default='model_evaluation.png', help='Image file')
+    parser.add_argument('--show', action='store_true', help='Also open the figure in a window')
+    args = parser.parse_args(argv)
+    plot_evaluation(args.evaluation_dir, args.output, args.show)
+
+
+if __name__ == '__main__':
+    main()
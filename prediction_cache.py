@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+# ═══════════════════════════════════════
+# Prediction Cache
+# ═══════════════════════════════════════
+def normalize_features(row):
+    # Hashable key independent of how the inputs were typed (numpy ints,
+    # bools, ints vs floats)
+    return tuple(float(value) for value in row)
+
+
+class PredictionCache:
+    # Bounded LRU cache of predictions with a time-to-live, keyed by
+    # (model version, *normalized features). One instance is shared by every
+    # session of the process, so all access goes through a lock. Sessions on
+    # the old and new model during a hot-swap each hit their own entries;
+    # entries of a retired version are no longer read and age out through
+    # the LRU.
+
+    def __init__(self, maxsize=10_000, ttl=3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version, row):
+        key = (version, *normalize_features(row))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, version, row, value):
+        key = (version, *normalize_features(row))
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, version, row, compute):
+        # The prediction is computed outside the lock; two sessions missing on
+        # the same key at once both compute it, which is harmless
+        value = self.get(version, row)
+        if value is None:
+            value = compute()
+            self.put(version, row, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+            }
@@ -1,255 +1,390 @@
+import argparse
+import os
+import time
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor, HistGradientBoostingRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
 import warnings
 
-warnings.filterwarnings('ignore')
-
-print("=" * 70)
-print("Jordan Real Estate Price Prediction System - Machine Learning")
-print("=" * 70)
-
-# ═══════════════════════════════════════
-# Data Loading
-# ═══════════════════════════════════════
-print("\nLoading dataset...")
-df = pd.read_csv('jordan_properties.csv')
-print(f"Successfully loaded {len(df)} properties\n")
-
-# ═══════════════════════════════════════
-# Data Preparation
-# ═══════════════════════════════════════
-print("Preparing data for modeling...")
-
-# Encode region names to numerical values
-le = LabelEncoder()
-df['المنطقة_رقم'] = le.fit_transform(df['المنطقة'])
-
-# Select features and target variable
-features = ['المساحة_متر', 'عدد_الغرف', 'عدد_الحمامات', 'عمر_البناء_سنوات',
-            'طابق', 'يوجد_مصعد', 'يوجد_موقف', 'يوجد_حديقة',
-            'يوجد_تدفئة_مركزية', 'قرب_الخدمات', 'المنطقة_رقم']
-
-X = df[features]
-y = df['السعر_دينار']
-
-print(f"Number of features: {len(features)}")
-print(f"Features used: {features}\n")
-
-# ═══════════════════════════════════════
-# Train-Test Split
-# ═══════════════════════════════════════
-print("Splitting dataset...")
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-
-print(f"Training set: {len(X_train)} properties")
-print(f"Testing set: {len(X_test)} properties\n")
-
-# ═══════════════════════════════════════
-# Model Training
-# ═══════════════════════════════════════
-print("=" * 70)
-print("Building and training models...")
-print("=" * 70)
-
-print("\n[1/3] Training Linear Regression...")
-lr_model = LinearRegression()
-lr_model.fit(X_train, y_train)
-lr_pred = lr_model.predict(X_test)
-print("   Completed")
-
-print("\n[2/3] Training Random Forest...")
-rf_model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
-rf_model.fit(X_train, y_train)
-rf_pred = rf_model.predict(X_test)
-print("   Completed")
-
-print("\n[3/3] Training Gradient Boosting...")
-gb_model = GradientBoostingRegressor(n_estimators=100, random_state=42)
-gb_model.fit(X_train, y_train)
-gb_pred = gb_model.predict(X_test)
-print("   Completed")
-
-# ═══════════════════════════════════════
-# Model Evaluation
-# ═══════════════════════════════════════
-print("\n" + "=" * 70)
-print("Model Performance Evaluation")
-print("=" * 70)
-
-models_results = []
-
-for name, predictions in [('Linear Regression', lr_pred),
-                          ('Random Forest', rf_pred),
-                          ('Gradient Boosting', gb_pred)]:
-    mae = mean_absolute_error(y_test, predictions)
-    rmse = np.sqrt(mean_squared_error(y_test, predictions))
-    r2 = r2_score(y_test, predictions)
-
-    models_results.append({
-        'Model': name,
-        'MAE': mae,
-        'RMSE': rmse,
-        'R2_Score': r2
-    })
-
-    print(f"\n{name}:")
-    print(f"   MAE: {mae:,.0f} JOD")
-    print(f"   RMSE: {rmse:,.0f} JOD")
-    print(f"   R² Score: {r2:.4f} ({r2 * 100:.2f}%)")
-
-results_df = pd.DataFrame(models_results)
+from evaluation_report import evaluation_dir, feature_importances, write_evaluation
+from feature_importance import cached_permutation_importances
+from feature_vector import FeatureEncoder
+from flat_forest import prediction_intervals
+from model_artifact import artifact_path, save_artifact
+from model_registry import register
+from update_model import linear_statistics
+from region_stats import build_region_index
+from property_dataset import (load_properties, dataset_fingerprint, features, target,
+                              region_column, region_code_column, regions_en)
 
-# ═══════════════════════════════════════
-# Best Model Selection
-# ═══════════════════════════════════════
-best_model_name = results_df.loc[results_df['R2_Score'].idxmax(), 'Model']
-print("\n" + "=" * 70)
-print(f"Best performing model: {best_model_name}")
-print("=" * 70)
-
-if best_model_name == 'Linear Regression':
-    best_model = lr_model
-    best_pred = lr_pred
-elif best_model_name == 'Random Forest':
-    best_model = rf_model
-    best_pred = rf_pred
-else:
-    best_model = gb_model
-    best_pred = gb_pred
-
-# ═══════════════════════════════════════
-# Feature Importance Analysis
-# ═══════════════════════════════════════
-if best_model_name in ['Random Forest', 'Gradient Boosting']:
-    print("\nFeature Importance Ranking:")
-    feature_importance = pd.DataFrame({
-        'Feature': features,
-        'Importance': best_model.feature_importances_
-    }).sort_values('Importance', ascending=False)
-
-    print(feature_importance.to_string(index=False))
+warnings.filterwarnings('ignore')
 
-# ═══════════════════════════════════════
-# Visualization
-# ═══════════════════════════════════════
-print("\nGenerating visualizations...")
-
-fig = plt.figure(figsize=(16, 10))
-
-# R² Score comparison
-plt.subplot(2, 3, 1)
-plt.bar(results_df['Model'], results_df['R2_Score'], color=['skyblue', 'lightgreen', 'coral'])
-plt.title('Model Comparison - R² Score', fontweight='bold', fontsize=12)
-plt.ylabel('R² Score')
-plt.ylim([0, 1])
-plt.xticks(rotation=15, ha='right')
-plt.grid(alpha=0.3, axis='y')
-
-# MAE comparison
-plt.subplot(2, 3, 2)
-plt.bar(results_df['Model'], results_df['MAE'], color=['gold', 'lightblue', 'pink'])
-plt.title('Model Comparison - MAE', fontweight='bold', fontsize=12)
-plt.ylabel('MAE (JOD)')
-plt.xticks(rotation=15, ha='right')
-plt.grid(alpha=0.3, axis='y')
-
-# Actual vs Predicted scatter plot
-plt.subplot(2, 3, 3)
-plt.scatter(y_test, best_pred, alpha=0.6, color='purple')
-plt.plot([y_test.min(), y_test.max()], [y_test.min(), y_test.max()], 'r--', lw=2)
-plt.title(f'Actual vs Predicted - {best_model_name}', fontweight='bold', fontsize=12)
-plt.xlabel('Actual Price (JOD)')
-plt.ylabel('Predicted Price (JOD)')
-plt.grid(alpha=0.3)
-
-# Error distribution
-plt.subplot(2, 3, 4)
-errors = y_test - best_pred
-plt.hist(errors, bins=50, color='teal', edgecolor='black', alpha=0.7)
-plt.title('Prediction Error Distribution', fontweight='bold', fontsize=12)
-plt.xlabel('Error (JOD)')
-plt.ylabel('Frequency')
-plt.grid(alpha=0.3, axis='y')
-
-# Feature importance chart
-if best_model_name in ['Random Forest', 'Gradient Boosting']:
-    plt.subplot(2, 3, 5)
-    top_features = feature_importance.head(10)
-    plt.barh(range(len(top_features)), top_features['Importance'], color='orange', alpha=0.7)
-    plt.yticks(range(len(top_features)), top_features['Feature'], fontsize=9)
-    plt.title('Top 10 Feature Importance', fontweight='bold', fontsize=12)
-    plt.xlabel('Importance')
-    plt.grid(alpha=0.3, axis='x')
-
-# Percentage error distribution
-plt.subplot(2, 3, 6)
-percentage_error = np.abs((y_test - best_pred) / y_test) * 100
-plt.hist(percentage_error, bins=50, color='salmon', edgecolor='black', alpha=0.7)
-plt.title('Percentage Error Distribution', fontweight='bold', fontsize=12)
-plt.xlabel('Error (%)')
-plt.ylabel('Frequency')
-plt.axvline(percentage_error.mean(), color='red', linestyle='--', linewidth=2,
-            label=f'Mean: {percentage_error.mean():.1f}%')
-plt.legend()
-plt.grid(alpha=0.3, axis='y')
-
-plt.tight_layout()
-plt.savefig('model_evaluation.png', dpi=300, bbox_inches='tight')
-print("Visualizations saved to: model_evaluation.png")
-plt.show()
 
 # ═══════════════════════════════════════
-# Model Testing with Real Examples
+# Pipeline Steps
 # ═══════════════════════════════════════
-print("\n" + "=" * 70)
-print("Testing Model with Real-World Examples")
-print("=" * 70)
-
-# Example 1: Luxury apartment in Abdoun
-example_1 = pd.DataFrame({
-    'المساحة_متر': [150],
-    'عدد_الغرف': [3],
-    'عدد_الحمامات': [2],
-    'عمر_البناء_سنوات': [5],
-    'طابق': [3],
-    'يوجد_مصعد': [1],
-    'يوجد_موقف': [1],
-    'يوجد_حديقة': [0],
-    'يوجد_تدفئة_مركزية': [1],
-    'قرب_الخدمات': [8],
-    'المنطقة_رقم': [le.transform(['عبدون'])[0]]
-})
-
-predicted_price_1 = best_model.predict(example_1)[0]
-print(f"\nExample 1: Apartment in Abdoun (150 sqm, 3 rooms, 5 years old)")
-print(f"   Predicted price: {predicted_price_1:,.0f} JOD")
-
-# Example 2: Standard apartment in Marka
-example_2 = pd.DataFrame({
-    'المساحة_متر': [120],
-    'عدد_الغرف': [2],
-    'عدد_الحمامات': [1],
-    'عمر_البناء_سنوات': [15],
-    'طابق': [1],
-    'يوجد_مصعد': [0],
-    'يوجد_موقف': [0],
-    'يوجد_حديقة': [0],
-    'يوجد_تدفئة_مركزية': [0],
-    'قرب_الخدمات': [5],
-    'المنطقة_رقم': [le.transform(['ماركا'])[0]]
-})
-
-predicted_price_2 = best_model.predict(example_2)[0]
-print(f"\nExample 2: Apartment in Marka (120 sqm, 2 rooms, 15 years old)")
-print(f"   Predicted price: {predicted_price_2:,.0f} JOD")
-
-print("\n" + "=" * 70)
-print("Model building completed successfully")
-print("=" * 70)
\ No newline at end of file
+def prepare_data(df):
+    # Encode region names to numerical values
+    le = LabelEncoder()
+    df[region_code_column] = le.fit_transform(df[region_column])
+
+    # Select features and target variable
+    return le, df[features], df[target]
+
+
+def build_models():
+    return {
+        'Linear Regression': LinearRegression(),
+        'Random Forest': RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1),
+        'Gradient Boosting': GradientBoostingRegressor(n_estimators=100, random_state=42),
+        # Histogram-based, multi-threaded, and splits regions as a native
+        # categorical instead of treating the LabelEncoder codes as ordered
+        'Hist Gradient Boosting': HistGradientBoostingRegressor(
+            max_iter=500, categorical_features=[feature == region_code_column for feature in features],
+            early_stopping=True, validation_fraction=0.1, n_iter_no_change=20, random_state=42),
+    }
+
+
+# Candidates that only ever use one core; the others share the remaining cores
+single_threaded_models = {'Linear Regression', 'Gradient Boosting'}
+
+
+def assign_cores(models, n_cores=None):
+    n_cores = n_cores or os.cpu_count() or 1
+    multi_threaded = [name for name in models if name not in single_threaded_models]
+    spare = max(n_cores - (len(models) - len(multi_threaded)), len(multi_threaded))
+    return {name: max(1, spare // len(multi_threaded)) if name in multi_threaded else 1
+            for name in models}
+
+
+def _fit_and_predict(name, model, n_threads, X_train, y_train, X_test):
+    # n_threads=None keeps the estimator's own threading settings
+    start = time.perf_counter()
+    if n_threads is not None and 'n_jobs' in model.get_params():
+        model.set_params(n_jobs=n_threads)
+    with threadpool_limits(limits=n_threads):
+        model.fit(X_train, y_train)
+        prediction = model.predict(X_test)
+    return name, model, prediction, time.perf_counter() - start
+
+
+def train_models(models, X_train, y_train, X_test, verbose=True, parallel=False):
+    # Returns the fitted models, their test-set predictions and fit+predict wall-clock seconds
+    fitted, predictions, times = {}, {}, {}
+
+    if parallel:
+        cores = assign_cores(models)
+        if verbose:
+            print("\nTraining all candidates in parallel: " +
+                  ", ".join(f"{name} ({cores[name]} core{'s' if cores[name] > 1 else ''})" for name in models))
+        results = Parallel(n_jobs=len(models))(
+            delayed(_fit_and_predict)(name, model, cores[name], X_train, y_train, X_test)
+            for name, model in models.items())
+    else:
+        results = []
+        for index, (name, model) in enumerate(models.items(), 1):
+            if verbose:
+                print(f"\n[{index}/{len(models)}] Training {name}...")
+            results.append(_fit_and_predict(name, model, None, X_train, y_train, X_test))
+            if verbose:
+                print("   Completed")
+
+    for name, model, prediction, seconds in results:
+        fitted[name] = model
+        predictions[name] = prediction
+        times[name] = seconds
+    return fitted, predictions, times
+
+
+def evaluate_models(y_test, predictions, verbose=True):
+    models_results = []
+
+    for name, prediction in predictions.items():
+        mae = mean_absolute_error(y_test, prediction)
+        rmse = np.sqrt(mean_squared_error(y_test, prediction))
+        r2 = r2_score(y_test, prediction)
+
+        models_results.append({
+            'Model': name,
+            'MAE': mae,
+            'RMSE': rmse,
+            'R2_Score': r2
+        })
+
+        if verbose:
+            print(f"\n{name}:")
+            print(f"   MAE: {mae:,.0f} JOD")
+            print(f"   RMSE: {rmse:,.0f} JOD")
+            print(f"   R² Score: {r2:.4f} ({r2 * 100:.2f}%)")
+
+    return pd.DataFrame(models_results)
+
+
+def region_metadata(df):
+    # Precomputed so the web app never scans the dataset per request
+    prices = df.groupby(region_column, observed=True)[target]
+    regions_ar = sorted(prices.groups)
+    return {
+        'regions_ar': regions_ar,
+        'regions_en': {region: regions_en.get(region, region) for region in regions_ar},
+        'avg_price': {region: float(price) for region, price in prices.mean().items()},
+        'count': {region: int(count) for region, count in prices.size().items()},
+    }
+
+
+def export_model(name, model, le, df, results_df, X_train, y_train, path=artifact_path, train_seconds=None):
+    metrics = results_df.set_index('Model').loc[name]
+    metadata = {
+        'model_name': name,
+        'features': features,
+        'metrics': {'MAE': float(metrics['MAE']), 'RMSE': float(metrics['RMSE']),
+                    'R2_Score': float(metrics['R2_Score'])},
+        'regions': region_metadata(df),
+        # rows: rows the model covers; dataset_rows: how far into the dataset
+        # file it has read (update_model.py continues from there)
+        'data': {'rows': len(df), 'dataset_rows': len(df), 'fingerprint': dataset_fingerprint(df)},
+        'train_seconds': train_seconds,
+    }
+    if isinstance(model, LinearRegression):
+        # Lets update_model.py fold new rows into the least-squares solution
+        metadata['linear_stats'] = linear_statistics(X_train, y_train)
+    return save_artifact(model, le, metadata, path, build_region_index(df))
+
+
+def select_serving_model(results_df, serve):
+    if serve == 'best':
+        return results_df.loc[results_df['R2_Score'].idxmax(), 'Model']
+    return serve
+
+
+def build_artifact(path=artifact_path, serve='Random Forest'):
+    # Evaluate the candidates and export the serving model without any output
+    df = load_properties()
+    le, X, y = prepare_data(df)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    models, predictions, times = train_models(build_models(), X_train, y_train, X_test, verbose=False)
+    results_df = evaluate_models(y_test, predictions, verbose=False)
+
+    name = select_serving_model(results_df, serve)
+    return export_model(name, models[name], le, df, results_df, X_train, y_train, path, times[name])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Train, evaluate and export the property price model')
+    parser.add_argument('--serve', default='Random Forest', choices=['best'] + list(build_models()),
+                        help="Model exported for the web app ('best' picks the highest R²)")
+    parser.add_argument('--artifact', default=artifact_path, help='Directory of the exported model artifact')
+    parser.add_argument('--register', action='store_true',
+                        help='Add the exported artifact to the model registry and make it the served version')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Fit the candidate models concurrently, splitting the cores between them')
+    parser.add_argument('--tune', action='store_true',
+                        help='Tune the tree models with cross-validated successive halving before training')
+    parser.add_argument('--tune-folds', type=int, default=5, help='Cross-validation folds used for tuning')
+    parser.add_argument('--tune-candidates', type=int, default=27,
+                        help='Random parameter candidates per model in the first halving round')
+    parser.add_argument('--permutation-repeats', type=int, default=5,
+                        help='Shuffles per feature for permutation importance (0 skips it)')
+    parser.add_argument('--headless', action='store_true',
+                        help='Skip the figure (no plotting library is imported); '
+                             'plot later with plot_evaluation.py')
+    parser.add_argument('--evaluation-dir', default=evaluation_dir,
+                        help='Directory for the JSON report and the test-set predictions')
+    args = parser.parse_args(argv)
+
+    print("=" * 70)
+    print("Jordan Real Estate Price Prediction System - Machine Learning")
+    print("=" * 70)
+
+    # ═══════════════════════════════════════
+    # Data Loading
+    # ═══════════════════════════════════════
+    print("\nLoading dataset...")
+    df = load_properties()
+    print(f"Successfully loaded {len(df)} properties\n")
+
+    # ═══════════════════════════════════════
+    # Data Preparation
+    # ═══════════════════════════════════════
+    print("Preparing data for modeling...")
+    le, X, y = prepare_data(df)
+
+    print(f"Number of features: {len(features)}")
+    print(f"Features used: {features}\n")
+
+    # ═══════════════════════════════════════
+    # Train-Test Split
+    # ═══════════════════════════════════════
+    print("Splitting dataset...")
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    print(f"Training set: {len(X_train)} properties")
+    print(f"Testing set: {len(X_test)} properties\n")
+
+    models = build_models()
+
+    # ═══════════════════════════════════════
+    # Hyperparameter Tuning
+    # ═══════════════════════════════════════
+    if args.tune:
+        print("=" * 70)
+        print("Tuning hyperparameters on the training set...")
+        print("=" * 70)
+
+        # Imported here so the default run does not pay for the experimental search module
+        from model_tuning import tune_models
+        tuned = tune_models(models, X_train, y_train, n_splits=args.tune_folds,
+                            n_candidates=args.tune_candidates)
+        for name, result in tuned.items():
+            models[name].set_params(**result['params'])
+        print()
+
+    # ═══════════════════════════════════════
+    # Model Training
+    # ═══════════════════════════════════════
+    print("=" * 70)
+    print("Building and training models...")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    models, predictions, train_times = train_models(models, X_train, y_train, X_test,
+                                                    parallel=args.parallel)
+    total_time = time.perf_counter() - start
+
+    print("\nTraining time (wall-clock):")
+    for name, seconds in train_times.items():
+        print(f"   {name}: {seconds:.2f}s")
+    print(f"   Total: {total_time:.2f}s")
+
+    # ═══════════════════════════════════════
+    # Model Evaluation
+    # ═══════════════════════════════════════
+    print("\n" + "=" * 70)
+    print("Model Performance Evaluation")
+    print("=" * 70)
+
+    results_df = evaluate_models(y_test, predictions)
+
+    # 10th-90th percentile band of the forest's trees, with its test-set coverage
+    intervals, interval_coverage = {}, {}
+    for name, model in models.items():
+        if isinstance(model, RandomForestRegressor):
+            band = intervals[name] = prediction_intervals(model, X_test)
+            interval_coverage[name] = float(((y_test >= band['lower']) & (y_test <= band['upper'])).mean())
+            print(f"\n{name} 10th-90th percentile band covers {interval_coverage[name]:.1%} of test prices "
+                  f"(median width {(band['upper'] - band['lower']).median():,.0f} JOD)")
+
+    # ═══════════════════════════════════════
+    # Best Model Selection
+    # ═══════════════════════════════════════
+    best_model_name = select_serving_model(results_df, 'best')
+    print("\n" + "=" * 70)
+    print(f"Best performing model: {best_model_name}")
+    print("=" * 70)
+
+    best_model = models[best_model_name]
+
+    # ═══════════════════════════════════════
+    # Feature Importance Analysis
+    # ═══════════════════════════════════════
+    importances = feature_importances(models, features)
+    if best_model_name in importances:
+        print("\nFeature Importance Ranking:")
+        feature_importance = pd.DataFrame({
+            'Feature': features,
+            'Importance': list(importances[best_model_name].values())
+        }).sort_values('Importance', ascending=False)
+
+        print(feature_importance.to_string(index=False))
+
+    # Permutation importance works for every candidate, Linear Regression included
+    permutation = {}
+    if args.permutation_repeats:
+        print(f"\nPermutation importance ({args.permutation_repeats} repeats, R² drop on the test set):")
+        for name, model in models.items():
+            start = time.perf_counter()
+            permutation[name], cached = cached_permutation_importances(model, X_test, y_test,
+                                                                       args.permutation_repeats)
+            print(f"   {name}: {'cached' if cached else f'{time.perf_counter() - start:.2f}s'}")
+
+        ranking = pd.DataFrame(permutation[best_model_name]).T.sort_values('mean', ascending=False)
+        print(f"\nPermutation Importance Ranking ({best_model_name}):")
+        print(ranking.rename_axis('Feature').reset_index().to_string(
+            index=False, formatters={'mean': '{:.4f}'.format, 'std': '{:.4f}'.format}))
+
+    # ═══════════════════════════════════════
+    # Model Export
+    # ═══════════════════════════════════════
+    serving_name = select_serving_model(results_df, args.serve)
+    artifact = export_model(serving_name, models[serving_name], le, df, results_df, X_train, y_train,
+                            args.artifact, train_times[serving_name])
+    print(f"\nServing model: {serving_name}")
+    print(f"Model artifact saved to: {args.artifact} (version {artifact.version})")
+    if args.register:
+        register(args.artifact, activate=True)
+        print(f"Registered and activated version {artifact.version} (running web apps switch to it)")
+
+    # ═══════════════════════════════════════
+    # Evaluation Report
+    # ═══════════════════════════════════════
+    write_evaluation({
+        'data': artifact.metadata['data'],
+        'features': features,
+        'metrics': results_df.to_dict('records'),
+        'train_seconds': train_times,
+        'best_model': best_model_name,
+        'serving_model': serving_name,
+        'artifact': {'path': args.artifact, 'version': artifact.version},
+        'feature_importances': importances,
+        'permutation_importances': permutation,
+        'interval_coverage': interval_coverage,
+    }, y_test, predictions, args.evaluation_dir, intervals)
+    print(f"Evaluation report saved to: {args.evaluation_dir}")
+
+    # ═══════════════════════════════════════
+    # Visualization
+    # ═══════════════════════════════════════
+    if not args.headless:
+        print("\nGenerating visualizations...")
+        # Imported here so headless runs never load matplotlib
+        from plot_evaluation import plot_evaluation
+        plot_evaluation(args.evaluation_dir, show=True)
+
+    # ═══════════════════════════════════════
+    # Model Testing with Real Examples
+    # ═══════════════════════════════════════
+    print("\n" + "=" * 70)
+    print("Testing Model with Real-World Examples")
+    print("=" * 70)
+
+    # Rows come from the serving feature encoder, in `numeric_columns` order:
+    # area, rooms, bathrooms, building age, floor, elevator, parking, garden,
+    # central heating, proximity to services
+    encoder = FeatureEncoder(le, regions_en)
+
+    # Example 1: Luxury apartment in Abdoun
+    example_1 = encoder.encode_row([150, 3, 2, 5, 3, 1, 1, 0, 1, 8], 'عبدون')
+    predicted_price_1 = best_model.predict(example_1[np.newaxis])[0]
+    print(f"\nExample 1: Apartment in Abdoun (150 sqm, 3 rooms, 5 years old)")
+    print(f"   Predicted price: {predicted_price_1:,.0f} JOD")
+
+    # Example 2: Standard apartment in Marka
+    example_2 = encoder.encode_row([120, 2, 1, 15, 1, 0, 0, 0, 0, 5], 'ماركا')
+    predicted_price_2 = best_model.predict(example_2[np.newaxis])[0]
+    print(f"\nExample 2: Apartment in Marka (120 sqm, 2 rooms, 15 years old)")
+    print(f"   Predicted price: {predicted_price_2:,.0f} JOD")
+
+    print("\n" + "=" * 70)
+    print("Model building completed successfully")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
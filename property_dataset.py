@@ -0,0 +1,192 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+# Default dataset locations
+csv_path = 'jordan_properties.csv'
+columnar_path = 'jordan_properties_data'
+
+region_column = 'المنطقة'
+region_code_column = 'المنطقة_رقم'
+target = 'السعر_دينار'
+
+# Model inputs in training order
+features = ['المساحة_متر', 'عدد_الغرف', 'عدد_الحمامات', 'عمر_البناء_سنوات',
+            'طابق', 'يوجد_مصعد', 'يوجد_موقف', 'يوجد_حديقة',
+            'يوجد_تدفئة_مركزية', 'قرب_الخدمات', region_code_column]
+
+# English display names of the regions
+regions_en = {
+    'عبدون': 'Abdoun', 'دير غبار': 'Deir Ghbar', 'أم أذينة': 'Um Uthaina',
+    'الصويفية': 'Sweifieh', 'خلدا': 'Khalda', 'أم السماق': 'Um Summaq',
+    'تلاع العلي': 'Tla Al Ali', 'الجاردنز': 'Gardens', 'الشميساني': 'Shmeisani',
+    'اللويبدة': 'Luweibdeh', 'الجبيهة': 'Jubeiha', 'صويلح': 'Sweileh',
+    'طبربور': 'Tabarbour', 'ماركا': 'Marka', 'شفا بدران': 'Shafa Badran',
+    'الياسمين': 'Yasmin', 'المقابلين': 'Maqablain', 'الهاشمي الشمالي': 'Hashemi North',
+    'جبل الحسين': 'Jabal Hussein', 'النصر': 'Nasr'
+}
+
+# Narrowest storage type of every dataset column (region is stored as category codes)
+column_dtypes = {
+    'المنطقة': np.uint8,
+    'المساحة_متر': np.uint16,
+    'عدد_الغرف': np.uint8,
+    'عدد_الحمامات': np.uint8,
+    'عمر_البناء_سنوات': np.uint8,
+    'طابق': np.uint8,
+    'يوجد_مصعد': np.uint8,
+    'يوجد_موقف': np.uint8,
+    'يوجد_حديقة': np.uint8,
+    'يوجد_تدفئة_مركزية': np.uint8,
+    'قرب_الخدمات': np.uint8,
+    'السعر_دينار': np.uint32,
+}
+columns = list(column_dtypes)
+
+meta_file = 'meta.json'
+format_version = 1
+
+
+def _column_file(index):
+    return f"column_{index:02d}.npy"
+
+
+def _source_stamp(source):
+    stat = os.stat(source)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def read_meta(path=columnar_path):
+    with open(os.path.join(path, meta_file), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def is_current(path=columnar_path, source=csv_path):
+    # The columnar copy is current when it was converted from the source as it is now
+    if not os.path.exists(os.path.join(path, meta_file)):
+        return False
+    if not os.path.exists(source):
+        return True
+    meta = read_meta(path)
+    return meta.get('format_version') == format_version and meta.get('source') == _source_stamp(source)
+
+
+# ═══════════════════════════════════════
+# CSV -> Columnar Conversion
+# ═══════════════════════════════════════
+def convert_csv(source=csv_path, path=columnar_path, chunk_size=1_000_000):
+    # Two chunked passes keep memory bounded: the first counts rows and
+    # collects the regions, the second fills preallocated .npy files.
+    n_rows = 0
+    region_values = set()
+    for chunk in pd.read_csv(source, usecols=[region_column], chunksize=chunk_size):
+        n_rows += len(chunk)
+        region_values.update(chunk[region_column].unique())
+
+    # Sorted categories make the codes identical to LabelEncoder's
+    categories = sorted(region_values)
+    if len(categories) > np.iinfo(column_dtypes[region_column]).max + 1:
+        raise ValueError(f"Too many regions for {np.dtype(column_dtypes[region_column])} codes: {len(categories)}")
+
+    tmp_path = path + '.tmp'
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    arrays = [np.lib.format.open_memmap(os.path.join(tmp_path, _column_file(index)), mode='w+',
+                                        dtype=dtype, shape=(n_rows,))
+              for index, dtype in enumerate(column_dtypes.values())]
+
+    offset = 0
+    for chunk in pd.read_csv(source, chunksize=chunk_size):
+        missing = [column for column in columns if column not in chunk.columns]
+        if missing:
+            raise ValueError(f"{source} is missing columns: {missing}")
+
+        end = offset + len(chunk)
+        for column, array in zip(columns, arrays):
+            if column == region_column:
+                values = pd.Categorical(chunk[column], categories=categories).codes
+            else:
+                values = chunk[column].to_numpy()
+                info = np.iinfo(array.dtype)
+                if values.min() < info.min or values.max() > info.max:
+                    raise ValueError(f"Column {column} does not fit in {array.dtype}")
+            array[offset:end] = values
+        offset = end
+
+    for array in arrays:
+        array.flush()
+    del arrays
+
+    meta = {
+        'format_version': format_version,
+        'rows': n_rows,
+        'columns': columns,
+        'dtypes': [np.dtype(dtype).name for dtype in column_dtypes.values()],
+        'categories': {region_column: categories},
+        'source': _source_stamp(source),
+    }
+    with open(os.path.join(tmp_path, meta_file), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+    return meta
+
+
+# ═══════════════════════════════════════
+# Loading
+# ═══════════════════════════════════════
+def load_properties(path=columnar_path, source=csv_path, mmap=True):
+    # Load the columnar dataset, (re)converting it first when the CSV changed
+    # (source=None loads the directory as is). Numeric columns stay memory-mapped and the region becomes a categorical.
+    if source is not None and not is_current(path, source):
+        convert_csv(source, path)
+
+    meta = read_meta(path)
+    data = {}
+    for index, column in enumerate(meta['columns']):
+        values = np.load(os.path.join(path, _column_file(index)), mmap_mode='r' if mmap else None)
+        if column in meta['categories']:
+            values = pd.Categorical.from_codes(values, categories=meta['categories'][column])
+        data[column] = values
+
+    return pd.DataFrame(data, copy=False)
+
+
+def dataset_fingerprint(df):
+    # SHA-256 over the raw column buffers, identifying the exact data a model saw
+    # (canonical storage dtypes, so a CSV and its columnar copy hash the same)
+    digest = hashlib.sha256()
+    for column in columns:
+        values = df[column]
+        if column == region_column:
+            values = values.astype('category').cat.remove_unused_categories()
+            digest.update(json.dumps(list(values.cat.categories), ensure_ascii=False).encode('utf-8'))
+            values = values.cat.codes.to_numpy()
+        else:
+            values = values.to_numpy().astype(column_dtypes[column], copy=False)
+        digest.update(np.ascontiguousarray(values).data)
+    return digest.hexdigest()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Convert the properties CSV to the columnar format')
+    parser.add_argument('--csv', default=csv_path, help='Source CSV file')
+    parser.add_argument('--output', default=columnar_path, help='Output directory')
+    parser.add_argument('--chunk-size', type=int, default=1_000_000, help='Rows parsed per chunk')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    meta = convert_csv(args.csv, args.output, args.chunk_size)
+    print(f"Converted {meta['rows']:,} properties to {args.output} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+import numpy as np
+
+from property_dataset import region_column, target
+
+area_column = 'المساحة_متر'
+
+
+# ═══════════════════════════════════════
+# Region Statistics Index
+# ═══════════════════════════════════════
+class RegionIndex:
+    # Prices and prices per sqm of every region, each sorted within its region
+    # and stored back to back; offsets[i]:offsets[i + 1] is region i's slice.
+    # Summary statistics are computed once, percentile ranks binary-search
+    # the region's sorted prices.
+
+    def __init__(self, regions, offsets, prices, price_per_sqm):
+        self.regions = list(regions)
+        self.offsets = offsets
+        self.prices = prices
+        self.price_per_sqm = price_per_sqm
+        self._position = {region: i for i, region in enumerate(self.regions)}
+        self._stats = {region: self._summary(i) for i, region in enumerate(self.regions)}
+
+    def _slice(self, array, i):
+        return array[self.offsets[i]:self.offsets[i + 1]]
+
+    def _summary(self, i):
+        prices = self._slice(self.prices, i)
+        per_sqm = self._slice(self.price_per_sqm, i)
+        return {
+            'count': len(prices),
+            'mean': float(prices.mean()),
+            'median': float(np.median(prices)),
+            'mean_price_per_sqm': float(per_sqm.mean()),
+            'median_price_per_sqm': float(np.median(per_sqm)),
+        }
+
+    def stats(self, region):
+        return self._stats[region]
+
+    def sorted_prices(self, region):
+        return self._slice(self.prices, self._position[region])
+
+    def percentile_rank(self, region, price):
+        # Share of the region's properties priced at or below `price`, in percent
+        prices = self.sorted_prices(region)
+        return 100.0 * np.searchsorted(prices, price, side='right') / len(prices)
+
+    def merged(self, df):
+        # New index including the rows of `df` (e.g. newly appended listings).
+        # Each region's sorted slice gets the new values inserted at their
+        # sorted positions, so only the new rows are sorted, never the corpus.
+        new_regions = df[region_column].astype(str).to_numpy(dtype=object)
+        new_prices = df[target].to_numpy(dtype=np.float64)
+        new_per_sqm = (df[target] / df[area_column]).to_numpy(dtype=np.float64)
+        names = sorted(set(self.regions).union(new_regions))
+        prices, per_sqm = [], []
+        for region in names:
+            rows = new_regions == region
+            i = self._position.get(region)
+            prices.append(_insert_sorted(self._slice(self.prices, i) if i is not None else None, new_prices[rows]))
+            per_sqm.append(_insert_sorted(self._slice(self.price_per_sqm, i) if i is not None else None,
+                                          new_per_sqm[rows]))
+        offsets = np.concatenate([[0], np.cumsum([len(slice_) for slice_ in prices])])
+        return RegionIndex(names, offsets, np.concatenate(prices), np.concatenate(per_sqm))
+
+    def save(self, path):
+        np.savez(path, regions=np.array(self.regions, dtype=str), offsets=self.offsets,
+                 prices=self.prices, price_per_sqm=self.price_per_sqm)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data['regions'].tolist(), data['offsets'], data['prices'], data['price_per_sqm'])
+
+
+def _insert_sorted(values, new):
+    # Sorted `values` (None for a new region) with `new` merged in
+    new = np.sort(new)
+    if values is None:
+        return new
+    return np.insert(values, np.searchsorted(values, new), new)
+
+
+def _build(regions, prices, per_sqm):
+    names, codes = np.unique(regions.astype(str), return_inverse=True)
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(names)))])
+    # Sorted by region, then by value: one lexsort per array
+    return RegionIndex(names.tolist(), offsets,
+                       prices[np.lexsort((prices, codes))],
+                       per_sqm[np.lexsort((per_sqm, codes))])
+
+
+def build_region_index(df):
+    return _build(df[region_column].astype(str).to_numpy(dtype=object),
+                  df[target].to_numpy(dtype=np.float64),
+                  (df[target] / df[area_column]).to_numpy(dtype=np.float64))
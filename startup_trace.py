@@ -0,0 +1,40 @@
+import threading
+import time
+
+
+# ═══════════════════════════════════════
+# Startup Trace
+# ═══════════════════════════════════════
+class StartupTrace:
+    # Seconds spent in each startup stage of a serving process. Every stage
+    # is recorded once (later calls are ignored, e.g. reruns or model swaps),
+    # and the trace is printed as soon as all expected stages are in.
+
+    def __init__(self, start=None, stages=('imports', 'data_load', 'first_render', 'model_load')):
+        self.start = time.perf_counter() if start is None else start
+        self.expected = stages
+        self.stages = {}
+        self.first_paint = None
+        self.reported = False
+        self._lock = threading.Lock()
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def record(self, stage, seconds):
+        with self._lock:
+            if stage in self.stages:
+                return False
+            self.stages[stage] = seconds
+            if stage == 'first_render':
+                self.first_paint = self.elapsed()
+            report = not self.reported and all(name in self.stages for name in self.expected)
+            self.reported = self.reported or report
+        if report:
+            print(self.summary())
+        return True
+
+    def summary(self):
+        parts = ', '.join(f"{stage.replace('_', ' ')} {seconds:.2f}s" for stage, seconds in self.stages.items())
+        first_paint = f" (first paint after {self.first_paint:.2f}s)" if self.first_paint is not None else ''
+        return f"Startup: {parts}{first_paint}"
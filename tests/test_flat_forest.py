@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+
+from flat_forest import flatten_forest
+from generate_jordan_data import generate_properties
+from price_properties_model import prepare_data
+
+
+@pytest.fixture(scope='module')
+def forest():
+    _, X, y = prepare_data(generate_properties(1_200, seed=3))
+    model = RandomForestRegressor(n_estimators=20, random_state=0, n_jobs=1).fit(X.iloc[:900], y.iloc[:900])
+    return model, X.iloc[900:]
+
+
+def test_flat_forest_matches_model_predict(forest):
+    model, X = forest
+    flat = flatten_forest(model)
+    expected = model.predict(X)
+    assert np.array_equal(flat.predict(X.to_numpy()), expected)
+    assert np.array_equal(flat.predict_interval(X.to_numpy())[0], expected)
+    assert [flat.predict_one(row) for row in X.to_numpy()[:50]] == list(expected[:50])
+
+
+def test_interval_matches_tree_percentiles(forest):
+    model, X = forest
+    flat = flatten_forest(model)
+    tree_values = np.stack([tree.predict(X.to_numpy(np.float32)) for tree in model.estimators_], axis=1)
+    low, high = np.percentile(tree_values, [10, 90], axis=1)
+
+    _, flat_low, flat_high = flat.predict_interval(X.to_numpy())
+    assert np.array_equal(flat_low, low) and np.array_equal(flat_high, high)
+    expected = model.predict(X)
+    for i, row in enumerate(X.to_numpy()[:50]):
+        assert flat.predict_one_interval(row) == (expected[i], low[i], high[i])
@@ -0,0 +1,22 @@
+import pytest
+
+from generate_jordan_data import generate_parallel, main
+
+
+def generate_merged(tmp_path, workers):
+    output = tmp_path / f'workers_{workers}' / 'properties.csv'
+    output.parent.mkdir()
+    main(['--rows', '1000', '--parallel-shards', '5', '--chunk-size', '150',
+          '--workers', str(workers), '--merge', '--output', str(output)])
+    return output.read_bytes()
+
+
+def test_output_does_not_depend_on_worker_count(tmp_path):
+    merged = generate_merged(tmp_path, 1)
+    assert merged == generate_merged(tmp_path, 3)
+    assert merged.decode('utf-8-sig').count('\n') == 1_001
+
+
+def test_more_shards_than_rows_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        generate_parallel(3, str(tmp_path / 'properties.csv'), n_shards=4)
@@ -0,0 +1,27 @@
+import warnings
+
+from sklearn.linear_model import LinearRegression
+
+from generate_jordan_data import generate_properties
+from inference_pool import predict_rows
+from model_artifact import save_artifact
+from model_registry import load_serving_artifact
+from price_properties_model import prepare_data, region_metadata
+from property_dataset import features
+
+
+def test_serving_copy_predicts_arrays_without_touching_warning_filters(tmp_path):
+    df = generate_properties(300, seed=4)
+    le, X, y = prepare_data(df)
+    model = LinearRegression().fit(X, y)
+    metadata = {'model_name': 'Linear Regression', 'features': features, 'metrics': {},
+                'regions': region_metadata(df), 'data': {'rows': len(df)}}
+    save_artifact(model, le, metadata, str(tmp_path / 'artifact'))
+
+    filters = list(warnings.filters)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        artifact = load_serving_artifact(str(tmp_path / 'artifact'))
+        price, _, _ = predict_rows(artifact.model, X.to_numpy()[:5])
+    assert warnings.filters == filters
+    assert (price == model.predict(X.iloc[:5])).all()
@@ -0,0 +1,21 @@
+from prediction_cache import PredictionCache
+
+
+def test_versions_share_the_cache_during_a_hot_swap():
+    # Sessions on the old and new model alternate without wiping each other
+    cache = PredictionCache(maxsize=4)
+    cache.put('old', [120, 3], 90_000.0)
+    cache.put('new', [120, 3], 95_000.0)
+    for _ in range(3):
+        assert cache.get('old', [120.0, 3.0]) == 90_000.0
+        assert cache.get('new', [120, 3]) == 95_000.0
+    assert cache.stats()['misses'] == 0
+
+
+def test_retired_version_ages_out_through_the_lru():
+    cache = PredictionCache(maxsize=2)
+    cache.put('old', [1], 1.0)
+    cache.put('new', [1], 2.0)
+    cache.put('new', [2], 3.0)
+    assert cache.get('old', [1]) is None
+    assert cache.stats()['evictions'] == 1
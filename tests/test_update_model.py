@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import r2_score
+
+from generate_jordan_data import generate_properties
+from model_artifact import load_artifact, save_artifact
+from price_properties_model import prepare_data, region_metadata
+from property_dataset import dataset_fingerprint, features, region_code_column, region_column, target
+from region_stats import build_region_index
+from update_model import update_artifact
+
+
+@pytest.fixture
+def forest_artifact(tmp_path):
+    df = generate_properties(2_600, seed=7)
+    base = df.iloc[:1_500].copy()
+    le, X, y = prepare_data(base)
+    model = RandomForestRegressor(n_estimators=50, random_state=42, n_jobs=1).fit(X, y)
+    metadata = {'model_name': 'Random Forest', 'features': features, 'metrics': {},
+                'regions': region_metadata(base),
+                'data': {'rows': len(base), 'dataset_rows': len(base), 'fingerprint': dataset_fingerprint(base)}}
+    path = str(tmp_path / 'artifact')
+    save_artifact(model, le, metadata, path)
+    return path, base, df.iloc[1_500:1_600], df.iloc[1_600:]
+
+
+def held_out_r2(model, le, test):
+    X = test.assign(**{region_code_column: le.transform(test[region_column])})[features]
+    return r2_score(test[target], model.predict(X))
+
+
+def test_small_updates_keep_held_out_r2_and_forest_size(forest_artifact):
+    # Five daily batches of 20 rows must not make the forest worse or bigger
+    path, base, batches, test = forest_artifact
+    before = load_artifact(path)
+    r2_before = held_out_r2(before.model, before.label_encoder, test)
+
+    for start in range(0, len(batches), 20):
+        covered = pd.concat([base, batches.iloc[:start]])
+        artifact, _, _ = update_artifact(batches.iloc[start:start + 20], path, old_df=covered, from_dataset=True)
+
+    assert len(artifact.model.estimators_) == 50
+    assert held_out_r2(artifact.model, artifact.label_encoder, test) >= r2_before - 0.005
+
+
+def test_new_data_batches_do_not_advance_dataset_offset(forest_artifact):
+    path, base, batches, _ = forest_artifact
+    artifact, _, _ = update_artifact(batches.iloc[:50], path, old_df=base)
+    assert artifact.metadata['data']['rows'] == 1_550
+    assert artifact.metadata['data']['dataset_rows'] == 1_500
+
+    artifact, _, _ = update_artifact(batches.iloc[50:], path, old_df=base, from_dataset=True)
+    assert artifact.metadata['data']['rows'] == 1_600
+    assert artifact.metadata['data']['dataset_rows'] == 1_550
+
+
+def test_region_index_merge_matches_rebuild():
+    df = generate_properties(2_000, seed=5).astype({region_column: str})
+    new = df.iloc[1_900:].copy()
+    new.loc[new.index[0], region_column] = 'منطقة جديدة'
+    merged = build_region_index(df.iloc[:1_900]).merged(new)
+    rebuilt = build_region_index(pd.concat([df.iloc[:1_900], new]))
+    assert merged.regions == rebuilt.regions
+    assert (merged.offsets == rebuilt.offsets).all()
+    assert (merged.prices == rebuilt.prices).all() and (merged.price_per_sqm == rebuilt.price_per_sqm).all()
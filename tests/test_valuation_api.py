@@ -0,0 +1,99 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+
+from feature_vector import numeric_columns
+from generate_jordan_data import generate_properties
+from model_artifact import save_artifact
+from model_registry import load_serving_artifact
+from price_properties_model import prepare_data, region_metadata
+from property_dataset import features, region_column, target
+from valuation_api import InProcessClient, ValuationService
+
+
+@pytest.fixture(scope='module')
+def properties():
+    return generate_properties(800, seed=11)
+
+
+@pytest.fixture(scope='module')
+def client(properties, tmp_path_factory):
+    le, X, y = prepare_data(properties)
+    model = RandomForestRegressor(n_estimators=20, random_state=0, n_jobs=1).fit(X, y)
+    metadata = {'model_name': 'Random Forest', 'features': features, 'metrics': {},
+                'regions': region_metadata(properties), 'data': {'rows': len(properties)}}
+    path = str(tmp_path_factory.mktemp('artifact') / 'artifact')
+    save_artifact(model, le, metadata, path)
+    holder = SimpleNamespace(current=load_serving_artifact(path))
+    return InProcessClient(ValuationService(holder, max_batch_rows=10)), model
+
+
+def records(properties, n):
+    return properties.drop(columns=[target]).head(n).to_dict('records')
+
+
+def test_predict_matches_model(client, properties):
+    client, model = client
+    record = records(properties, 1)[0]
+    status, response = asyncio.run(client.post('/predict', record))
+    assert status == 200
+    assert response['price'] == round(model.predict(prepare_data(properties.head(1))[1])[0])
+    assert response['lower'] <= response['price'] <= response['upper']
+
+
+def test_batch_reports_invalid_rows_and_limits_size(client, properties):
+    client, _ = client
+    batch = records(properties, 3)
+    batch[1] = dict(batch[1], **{region_column: 'Atlantis'})
+    status, response = asyncio.run(client.post('/predict/batch', {'properties': batch}))
+    assert status == 200
+    assert [('error' in result) for result in response['predictions']] == [False, True, False]
+
+    status, response = asyncio.run(client.post('/predict/batch', {'properties': records(properties, 11)}))
+    assert status == 413
+
+
+def test_bad_requests_and_health(client, properties):
+    client, _ = client
+    record = records(properties, 1)[0]
+    status, response = asyncio.run(client.post('/predict', dict(record, **{region_column: 'Atlantis'})))
+    assert (status, response) == (400, {'error': 'unknown region'})
+    status, _ = asyncio.run(client.post('/predict', {region_column: record[region_column]}))
+    assert status == 400
+    # Finite as a Python float, but inf once stored in the float32 row
+    status, _ = asyncio.run(client.post('/predict', dict(record, **{numeric_columns[0]: 1e40})))
+    assert status == 400
+
+    status, response = asyncio.run(client.get('/health'))
+    assert status == 200 and response['status'] == 'ok' and response['requests'] >= 2
+
+
+class FailingModel:
+    # Fails any batch containing a row whose first feature is `bad`
+    def __init__(self, model, bad):
+        self.model, self.bad = model, bad
+
+    def predict(self, X):
+        if (X[:, 0] == self.bad).any():
+            raise ValueError("cannot predict this row")
+        return self.model.predict(X)
+
+
+def test_failing_row_only_fails_its_own_request(client, properties):
+    client, _ = client
+    served = client.service.holder.current
+    broken = SimpleNamespace(model=FailingModel(served.model, 12_345), feature_encoder=served.feature_encoder,
+                             version=served.version, model_name=served.model_name)
+    service = ValuationService(SimpleNamespace(current=broken))
+    good, bad = records(properties, 2)
+    bad = dict(bad, **{numeric_columns[0]: 12_345})
+
+    async def requests():
+        service_client = InProcessClient(service)
+        return await asyncio.gather(service_client.post('/predict', good), service_client.post('/predict', bad))
+
+    (good_status, _), (bad_status, response) = asyncio.run(requests())
+    assert good_status == 200
+    assert (bad_status, response) == (500, {'error': 'Internal server error'})
@@ -0,0 +1,204 @@
+import argparse
+import hashlib
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+from model_artifact import artifact_path, load_artifact, read_metadata, save_artifact
+from property_dataset import (load_properties, dataset_fingerprint, features, target,
+                              region_column, region_code_column)
+
+
+# ═══════════════════════════════════════
+# Incremental Estimator Updates
+# ═══════════════════════════════════════
+def linear_statistics(X, y):
+    # Sufficient statistics of least squares: [1, X]ᵀ[1, X] and [1, X]ᵀy
+    A = np.column_stack([np.ones(len(X)), np.asarray(X, dtype=np.float64)])
+    return {'n': len(A), 'xtx': (A.T @ A).tolist(), 'xty': (A.T @ np.asarray(y, dtype=np.float64)).tolist()}
+
+
+def _update_linear(model, stats, X, y):
+    batch = linear_statistics(X, y)
+    xtx = np.array(stats['xtx']) + np.array(batch['xtx'])
+    xty = np.array(stats['xty']) + np.array(batch['xty'])
+    solution = np.linalg.lstsq(xtx, xty, rcond=None)[0]
+    model.intercept_ = solution[0]
+    model.coef_ = solution[1:]
+    return {'n': stats['n'] + batch['n'], 'xtx': xtx.tolist(), 'xty': xty.tolist()}
+
+
+def added_trees(n_trees, new_rows, covered_rows):
+    # Trees (or stages) in proportion to the batch's share of all covered
+    # rows, so a small batch cannot outweigh the trees fitted on the dataset
+    return max(1, round(n_trees * new_rows / (covered_rows + new_rows)))
+
+
+def replay_sample(old_df, label_encoder, n_rows=10_000, seed=0):
+    # Random sample of rows the model already covers; new trees are fitted on
+    # it together with the new rows, so each is as good as the original ones.
+    # Positions are drawn first and only the sampled rows are encoded, so the
+    # cost does not grow with the covered corpus.
+    if len(old_df) > n_rows:
+        index = np.sort(np.random.default_rng(seed).choice(len(old_df), n_rows, replace=False))
+        old_df = old_df.iloc[index]
+    X_old = old_df.assign(**{region_code_column: label_encoder.transform(old_df[region_column])})[features]
+    return X_old, old_df[target]
+
+
+def update_estimator(model, X, y, new_trees=10, linear_stats=None, retire=False):
+    # Extra trees for a forest, extra stages for gradient boosting (both fitted
+    # on X, y: the new rows plus a replay sample), or the new rows folded into
+    # the normal equations for linear regression. With `retire`, a forest drops
+    # as many of its oldest trees as it gained, so its size stays fixed.
+    # Returns the updated linear statistics (None for tree models).
+    if isinstance(model, RandomForestRegressor):
+        model.set_params(warm_start=True, n_estimators=len(model.estimators_) + new_trees)
+        model.fit(X, y)
+        if retire:
+            model.estimators_ = model.estimators_[new_trees:]
+            model.set_params(n_estimators=len(model.estimators_))
+    elif isinstance(model, GradientBoostingRegressor):
+        model.set_params(warm_start=True, n_estimators=model.n_estimators_ + new_trees)
+        model.fit(X, y)
+    elif isinstance(model, LinearRegression):
+        if linear_stats is None:
+            raise ValueError("The artifact has no linear statistics; retrain with price_properties_model.py")
+        return _update_linear(model, linear_stats, X, y)
+    else:
+        # HistGradientBoostingRegressor re-bins on every warm-start fit, which
+        # breaks its earlier categorical splits when a batch lacks a region.
+        raise TypeError(f"{type(model).__name__} cannot be updated incrementally; "
+                        f"retrain with price_properties_model.py")
+    return None
+
+
+def merge_region_metadata(regions, new_df):
+    # Fold the new rows into the per-region averages and counts
+    regions = {key: dict(value) if isinstance(value, dict) else list(value) for key, value in regions.items()}
+    prices = new_df.groupby(region_column, observed=True)[target].agg(['size', 'sum'])
+    for region, (count, total) in prices.iterrows():
+        old_count = regions['count'].get(region, 0)
+        old_total = regions['avg_price'].get(region, 0.0) * old_count
+        regions['count'][region] = int(old_count + count)
+        regions['avg_price'][region] = float((old_total + total) / (old_count + count))
+    return regions
+
+
+def read_new_rows(path):
+    # New listings as a CSV file or a columnar directory
+    if os.path.isdir(path):
+        return load_properties(path, source=None)
+    return pd.read_csv(path)
+
+
+# ═══════════════════════════════════════
+# Update Workflow
+# ═══════════════════════════════════════
+def update_artifact(new_df, path=artifact_path, new_trees=None, old_df=None, from_dataset=False):
+    # old_df: rows the model already covers, replayed when fitting new trees;
+    # from_dataset: new_df continues the dataset file (advances dataset_rows)
+    artifact = load_artifact(path, mmap=False)
+    le = artifact.label_encoder
+
+    unknown = sorted(set(new_df[region_column].unique()) - set(le.classes_))
+    if unknown:
+        raise ValueError(f"New rows contain regions the model has never seen: {unknown}; "
+                         f"retrain with price_properties_model.py")
+
+    X_new = new_df.assign(**{region_code_column: le.transform(new_df[region_column])})[features]
+    y_new = new_df[target]
+
+    # Test-then-train: the new rows are unseen data for the current model
+    prediction = artifact.model.predict(X_new)
+    pre_update_metrics = {
+        'MAE': float(mean_absolute_error(y_new, prediction)),
+        'RMSE': float(np.sqrt(mean_squared_error(y_new, prediction))),
+        'R2_Score': float(r2_score(y_new, prediction)) if len(new_df) > 1 else None,
+    }
+
+    model = artifact.model
+    data = dict(artifact.metadata['data'])
+    if new_trees is None:
+        size = len(model.estimators_) if isinstance(model, RandomForestRegressor) else getattr(model, 'n_estimators_', 1)
+        new_trees = added_trees(size, len(new_df), data['rows'])
+    X_fit, y_fit, replayed = X_new, y_new, False
+    if old_df is not None and not old_df.empty and not isinstance(model, LinearRegression):
+        X_old, y_old = replay_sample(old_df, le, seed=len(data.get('updates', [])))
+        X_fit, y_fit, replayed = pd.concat([X_old, X_new]), pd.concat([y_old, y_new]), True
+
+    start = time.perf_counter()
+    # Old trees are only retired for trees that saw a replay sample too
+    linear_stats = update_estimator(model, X_fit, y_fit, new_trees, artifact.metadata.get('linear_stats'),
+                                    retire=replayed)
+    update_seconds = time.perf_counter() - start
+
+    metadata = dict(artifact.metadata)
+    batch_fingerprint = dataset_fingerprint(new_df)
+    # Artifacts from before dataset_rows existed only ever read the dataset
+    data.setdefault('dataset_rows', data['rows'])
+    data['rows'] += len(new_df)
+    if from_dataset:
+        data['dataset_rows'] += len(new_df)
+    data['fingerprint'] = hashlib.sha256((data['fingerprint'] + batch_fingerprint).encode()).hexdigest()
+    data['updates'] = data.get('updates', []) + [{
+        'rows_added': len(new_df),
+        'trees_added': new_trees if linear_stats is None else 0,
+        'fingerprint': batch_fingerprint,
+        'previous_version': artifact.version,
+        'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'pre_update_metrics': pre_update_metrics,
+    }]
+    metadata['data'] = data
+    metadata['regions'] = merge_region_metadata(metadata['regions'], new_df)
+    if linear_stats is not None:
+        metadata['linear_stats'] = linear_stats
+
+    region_index = artifact.region_index.merged(new_df) if artifact.region_index is not None else None
+    return save_artifact(artifact.model, le, metadata, path, region_index), pre_update_metrics, update_seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Update the exported model with newly appended listings')
+    parser.add_argument('--artifact', default=artifact_path, help='Directory of the exported model artifact')
+    parser.add_argument('--new-data', default=None,
+                        help='CSV file or columnar directory holding only the new rows '
+                             '(default: rows of the dataset beyond those the model covers)')
+    parser.add_argument('--new-trees', type=int, default=None,
+                        help='Trees (forest) or stages (gradient boosting) added per update '
+                             '(default: in proportion to the new rows\' share of all covered rows)')
+    args = parser.parse_args(argv)
+
+    data = read_metadata(args.artifact)['data']
+    dataset_rows = data.get('dataset_rows', data['rows'])
+    if args.new_data:
+        new_df = read_new_rows(args.new_data)
+        try:
+            old_df = load_properties().iloc[:dataset_rows]
+        except FileNotFoundError:
+            print("Dataset not found - new trees are fitted on the new rows only")
+            old_df = None
+    else:
+        df = load_properties()
+        old_df, new_df = df.iloc[:dataset_rows], df.iloc[dataset_rows:]
+
+    if new_df.empty:
+        print("Model is up to date - no new rows")
+        return
+
+    print(f"Updating model with {len(new_df):,} new properties...")
+    artifact, metrics, seconds = update_artifact(new_df, args.artifact, args.new_trees, old_df,
+                                                 from_dataset=not args.new_data)
+    print(f"   Current model on new rows: MAE {metrics['MAE']:,.0f} JOD, RMSE {metrics['RMSE']:,.0f} JOD")
+    print(f"   Update time: {seconds:.2f}s")
+    print(f"Model artifact saved to: {args.artifact} (version {artifact.version}, "
+          f"covers {artifact.metadata['data']['rows']:,} rows)")
+
+
+if __name__ == '__main__':
+    main()
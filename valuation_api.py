@@ -0,0 +1,349 @@
+import argparse
+import asyncio
+import json
+import time
+from http import HTTPStatus
+
+import numpy as np
+
+from inference_pool import predict_rows
+from model_artifact import serving_path
+from model_registry import ActiveModel
+from property_dataset import region_column
+
+
+class RequestError(Exception):
+    # Invalid request payload, answered with 400 Bad Request
+    status = HTTPStatus.BAD_REQUEST
+
+
+class RequestTooLarge(RequestError):
+    # Body or batch above the configured limits, answered with 413
+    status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+
+# ═══════════════════════════════════════
+# Prediction Helpers
+# ═══════════════════════════════════════
+def prediction_result(price, lower, upper, i, version):
+    result = {'price': round(float(price[i]))}
+    if lower is not None:
+        result['lower'] = round(float(lower[i]))
+        result['upper'] = round(float(upper[i]))
+    result['model_version'] = version
+    return result
+
+
+class MicroBatcher:
+    # Collects single-row requests arriving within `max_delay` seconds (or up
+    # to `max_batch` rows) and answers all of them with one vectorized predict.
+    # Every row carries the artifact it was encoded with, so a batch spanning
+    # a model swap is split per model.
+
+    def __init__(self, max_delay=0.002, max_batch=256):
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.batches = 0
+        self.rows = 0
+        self._pending = []
+        self._timer = None
+
+    async def predict(self, artifact, row):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((artifact, row, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        by_model = {}
+        for item in pending:
+            by_model.setdefault(id(item[0]), []).append(item)
+        for items in by_model.values():
+            self._run(items)
+
+    def _run(self, items):
+        artifact = items[0][0]
+        X = np.array([row for _, row, _ in items], dtype=np.float32)
+        try:
+            price, lower, upper = predict_rows(artifact.model, X)
+        except Exception as exc:
+            if len(items) > 1:
+                # Retry row by row so only the offending request gets the error
+                for item in items:
+                    self._run([item])
+                return
+            future = items[0][2]
+            if not future.done():
+                future.set_exception(exc)
+            return
+        self.batches += 1
+        self.rows += len(items)
+        for i, (_, _, future) in enumerate(items):
+            if not future.done():
+                future.set_result(prediction_result(price, lower, upper, i, artifact.version))
+
+
+# ═══════════════════════════════════════
+# Valuation Service
+# ═══════════════════════════════════════
+class ValuationService:
+    # Routes JSON requests to the micro-batcher (/predict) or to one
+    # vectorized pass over the submitted table (/predict/batch). Batches run
+    # on the event loop, so their size is capped to bound the time they
+    # hold up other connections.
+
+    def __init__(self, holder, max_delay=0.002, max_batch=256, max_batch_rows=1_000):
+        self.holder = holder
+        self.batcher = MicroBatcher(max_delay, max_batch)
+        self.max_batch_rows = max_batch_rows
+        self.requests = 0
+
+    def encode_property(self, artifact, payload):
+        # Same schema as jordan_properties.csv; region by Arabic or English name
+        if not isinstance(payload, dict):
+            raise RequestError("Expected a JSON object")
+        try:
+            return artifact.feature_encoder.encode_record(payload)
+        except ValueError as exc:
+            raise RequestError(str(exc))
+
+    async def predict(self, payload):
+        # One snapshot for encoding and prediction
+        artifact = self.holder.current
+        return await self.batcher.predict(artifact, self.encode_property(artifact, payload))
+
+    def predict_batch(self, payload):
+        properties = payload.get('properties') if isinstance(payload, dict) else None
+        if not isinstance(properties, list) or not properties:
+            raise RequestError("Expected {\"properties\": [...]} with at least one property")
+        if len(properties) > self.max_batch_rows:
+            raise RequestTooLarge(f"At most {self.max_batch_rows:,} properties per batch")
+        artifact = self.holder.current
+        X, errors = artifact.feature_encoder.encode_records(properties)
+        valid = np.array([not error for error in errors])
+        results = [{'error': error} for error in errors]
+        if valid.any():
+            price, lower, upper = predict_rows(artifact.model, X[valid])
+            for i, row in enumerate(np.flatnonzero(valid)):
+                results[row] = prediction_result(price, lower, upper, i, artifact.version)
+        return {'predictions': results}
+
+    def health(self):
+        batcher = self.batcher
+        return {
+            'status': 'ok',
+            'model_version': self.holder.current.version,
+            'model_name': self.holder.current.model_name,
+            'requests': self.requests,
+            'batches': batcher.batches,
+            'mean_batch_size': batcher.rows / batcher.batches if batcher.batches else 0.0,
+        }
+
+    async def handle(self, method, path, body):
+        # Returns (status, JSON-serializable response)
+        self.requests += 1
+        try:
+            if method == 'GET' and path == '/health':
+                return HTTPStatus.OK, self.health()
+            if method != 'POST' or path not in ('/predict', '/predict/batch'):
+                return HTTPStatus.NOT_FOUND, {'error': f"No route for {method} {path}"}
+            try:
+                payload = json.loads(body or b'null')
+            except ValueError:
+                raise RequestError("Body is not valid JSON")
+            if path == '/predict':
+                return HTTPStatus.OK, await self.predict(payload)
+            return HTTPStatus.OK, self.predict_batch(payload)
+        except RequestError as exc:
+            return exc.status, {'error': str(exc)}
+        except Exception as exc:
+            # Still answer, so the connection gets a response instead of a reset
+            print(f"Error handling {method} {path}: {exc!r}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': 'Internal server error'}
+
+
+# ═══════════════════════════════════════
+# HTTP/1.1 Server
+# ═══════════════════════════════════════
+async def read_request(reader, max_body=1 << 20):
+    # (method, path, headers, body) of the next request, or None at EOF;
+    # a body above `max_body` bytes is refused before it is read
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError as exc:
+        if not exc.partial:
+            return None
+        raise
+    request_line, *header_lines = head.decode('latin-1').split('\r\n')
+    method, path, _ = request_line.split(' ', 2)
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(':')
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length', 0))
+    if length > max_body:
+        raise RequestTooLarge(f"Body larger than {max_body:,} bytes")
+    body = await reader.readexactly(length) if length else b''
+    return method, path, headers, body
+
+
+def write_response(writer, status, response, keep_alive=True):
+    body = json.dumps(response, ensure_ascii=False).encode('utf-8')
+    writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                 f"Content-Type: application/json; charset=utf-8\r\n"
+                 f"Content-Length: {len(body)}\r\n"
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body)
+
+
+async def serve_connection(service, reader, writer):
+    # Keep-alive connection: requests are answered in order
+    try:
+        while True:
+            try:
+                request = await read_request(reader)
+            except RequestTooLarge as exc:
+                # The body is left unread, so the connection cannot be reused
+                write_response(writer, exc.status, {'error': str(exc)}, False)
+                break
+            except (ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                write_response(writer, HTTPStatus.BAD_REQUEST, {'error': 'Malformed HTTP request'}, False)
+                break
+            if request is None:
+                break
+            method, path, headers, body = request
+            status, response = await service.handle(method, path, body)
+            keep_alive = headers.get('connection', '').lower() != 'close'
+            write_response(writer, status, response, keep_alive)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(service, host='127.0.0.1', port=8000):
+    return await asyncio.start_server(lambda r, w: serve_connection(service, r, w), host, port)
+
+
+# ═══════════════════════════════════════
+# Clients
+# ═══════════════════════════════════════
+class InProcessClient:
+    # Calls the service directly, without sockets (tests and notebooks)
+
+    def __init__(self, service):
+        self.service = service
+
+    async def get(self, path):
+        status, response = await self.service.handle('GET', path, b'')
+        return status.value, response
+
+    async def post(self, path, payload):
+        status, response = await self.service.handle('POST', path, json.dumps(payload).encode('utf-8'))
+        return status.value, response
+
+
+class HTTPClient:
+    # Minimal keep-alive HTTP/1.1 JSON client for one connection
+
+    def __init__(self, host='127.0.0.1', port=8000):
+        self.host = host
+        self.port = port
+        self._reader = self._writer = None
+
+    async def post(self, path, payload):
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        body = json.dumps(payload).encode('utf-8')
+        self._writer.write(f"POST {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                           f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                           .encode('latin-1') + body)
+        await self._writer.drain()
+        status_line, *header_lines = (await self._reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+        length = 0
+        for line in header_lines:
+            name, _, value = line.partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value)
+        return int(status_line.split()[1]), json.loads(await self._reader.readexactly(length))
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+
+
+async def load_test(host, port, payload, n_requests=5000, concurrency=64):
+    # Throughput and latency of /predict over real connections
+    clients = [HTTPClient(host, port) for _ in range(concurrency)]
+    latencies = []
+
+    async def worker(client, count):
+        for _ in range(count):
+            start = time.perf_counter()
+            status, _ = await client.post('/predict', payload)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                raise RuntimeError(f"/predict answered {status}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(client, n_requests // concurrency) for client in clients))
+    seconds = time.perf_counter() - start
+    for client in clients:
+        await client.close()
+    latency_ms = np.array(latencies) * 1000
+    return {'requests': len(latencies), 'seconds': seconds, 'per_second': len(latencies) / seconds,
+            'p50_ms': float(np.percentile(latency_ms, 50)), 'p99_ms': float(np.percentile(latency_ms, 99))}
+
+
+example_property = {
+    'المساحة_متر': 150, 'عدد_الغرف': 3, 'عدد_الحمامات': 2, 'عمر_البناء_سنوات': 5, 'طابق': 3,
+    'يوجد_مصعد': 1, 'يوجد_موقف': 1, 'يوجد_حديقة': 0, 'يوجد_تدفئة_مركزية': 1, 'قرب_الخدمات': 8,
+    region_column: 'Abdoun',
+}
+
+
+async def run(args):
+    service = ValuationService(ActiveModel(fallback_path=serving_path), args.max_delay_ms / 1000, args.max_batch,
+                               args.max_batch_rows)
+    server = await start_server(service, args.host, args.port)
+    print(f"Valuation API listening on http://{args.host}:{args.port} "
+          f"(model {service.holder.current.version})")
+    async with server:
+        if args.load_test:
+            result = await load_test(args.host, args.port, example_property, args.load_test, args.concurrency)
+            print(f"{result['requests']:,} requests in {result['seconds']:.2f}s "
+                  f"({result['per_second']:,.0f}/s), p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, "
+                  f"mean batch {service.health()['mean_batch_size']:.1f} rows")
+            return
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='JSON HTTP valuation API with request micro-batching')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on')
+    parser.add_argument('--max-delay-ms', type=float, default=2.0,
+                        help='How long a request waits for others to share its predict call')
+    parser.add_argument('--max-batch', type=int, default=256, help='Rows per predict call at most')
+    parser.add_argument('--max-batch-rows', type=int, default=1_000,
+                        help='Properties accepted per /predict/batch request (more are refused with 413)')
+    parser.add_argument('--load-test', type=int, default=0, metavar='N',
+                        help='Send N /predict requests over loopback, print throughput and latency, then exit')
+    parser.add_argument('--concurrency', type=int, default=64, help='Connections used by --load-test')
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,16 @@
+import time
+script_start = time.perf_counter()
+import os
 import streamlit as st
-import pandas as pd
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import LabelEncoder
-import plotly.graph_objects as go
+
+# Only light modules at the top: plotly, pandas and sklearn are imported
+# where first needed, and the model loads on a background thread
+from model_artifact import serving_path, metadata_file, read_metadata
+from model_registry import ActiveModel, active_version, load_serving_artifact, version_path
+from prediction_cache import PredictionCache
+from startup_trace import StartupTrace
+
+imports_seconds = time.perf_counter() - script_start
 
 st.set_page_config(
     page_title="RealPredict - Smart Real Estate Valuation",
@@ -40,12 +48,29 @@ translations = {
         'your_property': 'Your Property',
         'regional_avg': 'Regional Average',
         'ready': 'Ready to Estimate',
+        'loading_model': 'Loading the valuation model...',
         'enter_details': 'Enter property details and click',
         'language': 'Language',
         'theme': 'Theme',
         'light': 'Light',
         'dark': 'Dark',
-        'floor': 'Floor Number'
+        'floor': 'Floor Number',
+        'interval': 'Likely range (10th-90th percentile)',
+        'percentile': 'Region Percentile',
+        'cache_stats': 'Prediction cache: {hits:,} hits, {misses:,} misses, {size:,} entries',
+        'pool_stats': 'Inference pool: queue {queue_depth} (max {max_queue_depth}), '
+                      'mean batch {mean_batch_size:.1f} (max {max_batch_size})',
+        'mode': 'Mode',
+        'single_mode': 'Single property',
+        'bulk_mode': 'Bulk valuation',
+        'bulk_title': 'Bulk Valuation',
+        'bulk_help': 'Upload a CSV or Parquet file with the columns of jordan_properties.csv '
+                     '(region in Arabic or English). The price column is optional.',
+        'upload': 'Properties file',
+        'valuing': 'Valuing properties',
+        'valued': 'Valued {valid:,} properties in {seconds:.1f}s',
+        'invalid_rows': '{invalid:,} rows could not be valued - see the error column',
+        'download': 'Download results'
     },
     'ar': {
         'title': 'RealPredict',
@@ -74,12 +99,29 @@ translations = {
         'your_property': 'عقارك',
         'regional_avg': 'المتوسط الإقليمي',
         'ready': 'جاهز للتقييم',
+        'loading_model': 'جارٍ تحميل نموذج التقييم...',
         'enter_details': 'أدخل تفاصيل العقار واضغط',
         'language': 'اللغة',
         'theme': 'المظهر',
         'light': 'فاتح',
         'dark': 'داكن',
-        'floor': 'رقم الطابق'
+        'floor': 'رقم الطابق',
+        'interval': 'النطاق المرجح (المئين 10-90)',
+        'percentile': 'الترتيب في المنطقة',
+        'cache_stats': 'ذاكرة التنبؤات: {hits:,} إصابة، {misses:,} إخفاق، {size:,} مدخل',
+        'pool_stats': 'مجمع الاستدلال: الطابور {queue_depth} (الأقصى {max_queue_depth})، '
+                      'متوسط الدفعة {mean_batch_size:.1f} (الأقصى {max_batch_size})',
+        'mode': 'الوضع',
+        'single_mode': 'عقار واحد',
+        'bulk_mode': 'تقييم جماعي',
+        'bulk_title': 'التقييم الجماعي',
+        'bulk_help': 'ارفع ملف CSV أو Parquet بأعمدة jordan_properties.csv '
+                     '(المنطقة بالعربية أو الإنجليزية). عمود السعر اختياري.',
+        'upload': 'ملف العقارات',
+        'valuing': 'جاري تقييم العقارات',
+        'valued': 'تم تقييم {valid:,} عقار في {seconds:.1f} ثانية',
+        'invalid_rows': 'تعذر تقييم {invalid:,} صف - راجع عمود الخطأ',
+        'download': 'تنزيل النتائج'
     }
 }
 
@@ -123,6 +165,9 @@ lang = st.session_state.lang
 theme = st.session_state.theme
 t = translations[lang]
 
+with st.sidebar:
+    mode = st.radio(t['mode'], options=['single', 'bulk'], format_func=lambda x: t[f'{x}_mode'], key='mode')
+
 # Dynamic CSS
 bg_gradient = 'linear-gradient(135deg, #f5f7fa 0%, #e8ecf1 100%)' if theme == 'light' else 'linear-gradient(135deg, #0f172a 0%, #1e293b 100%)'
 card_bg = '#ffffff' if theme == 'light' else '#1e293b'
@@ -341,6 +386,13 @@ st.markdown(f"""
         margin-bottom: 2rem;
     }}
 
+    .result-range {{
+        color: rgba(255, 255, 255, 0.85);
+        font-size: 1rem;
+        font-weight: 500;
+        margin: -1.25rem 0 2rem 0;
+    }}
+
     .trend-container {{
         background: rgba(255, 255, 255, 0.95);
         border-radius: 16px;
@@ -514,7 +566,7 @@ st.markdown(f"""
         color: {checkbox_text} !important;
     }}
 
-    .stButton>button {{
+    .stButton>button, .stFormSubmitButton>button {{
         width: 100%;
         background: linear-gradient(135deg, #2a5298 0%, #1e3c72 100%);
         color: white;
@@ -530,7 +582,7 @@ st.markdown(f"""
         letter-spacing: 1px;
     }}
 
-    .stButton>button:hover {{
+    .stButton>button:hover, .stFormSubmitButton>button:hover {{
         transform: translateY(-3px);
         box-shadow: 0 10px 30px rgba(42, 82, 152, 0.45);
     }}
@@ -584,38 +636,86 @@ st.markdown(f"""
 """, unsafe_allow_html=True)
 
 
-# Load Model
+# Startup stages of this server process, recorded by its first session
+@st.cache_resource
+def startup_trace():
+    return StartupTrace(start=script_start)
+
+
+# Load Model: the registry's active version (or the exported artifact when
+# nothing is registered), swapped in the background when the pointer moves.
+# The first load also runs in the background, so the form renders meanwhile.
 @st.cache_resource
 def load_model():
-    df = pd.read_csv('jordan_properties.csv')
-    le = LabelEncoder()
-    df['المنطقة_رقم'] = le.fit_transform(df['المنطقة'])
-
-    features = ['المساحة_متر', 'عدد_الغرف', 'عدد_الحمامات', 'عمر_البناء_سنوات',
-                'طابق', 'يوجد_مصعد', 'يوجد_موقف', 'يوجد_حديقة',
-                'يوجد_تدفئة_مركزية', 'قرب_الخدمات', 'المنطقة_رقم']
-
-    X = df[features]
-    y = df['السعر_دينار']
-
-    model = RandomForestRegressor(n_estimators=100, random_state=42)
-    model.fit(X, y)
-
-    regions_ar = sorted(df['المنطقة'].unique())
-    regions_en = {
-        'عبدون': 'Abdoun', 'دير غبار': 'Deir Ghbar', 'أم أذينة': 'Um Uthaina',
-        'الصويفية': 'Sweifieh', 'خلدا': 'Khalda', 'أم السماق': 'Um Summaq',
-        'تلاع العلي': 'Tla Al Ali', 'الجاردنز': 'Gardens', 'الشميساني': 'Shmeisani',
-        'اللويبدة': 'Luweibdeh', 'الجبيهة': 'Jubeiha', 'صويلح': 'Sweileh',
-        'طبربور': 'Tabarbour', 'ماركا': 'Marka', 'شفا بدران': 'Shafa Badran',
-        'الياسمين': 'Yasmin', 'المقابلين': 'Maqablain', 'الهاشمي الشمالي': 'Hashemi North',
-        'جبل الحسين': 'Jabal Hussein', 'النصر': 'Nasr'
-    }
+    trace = startup_trace()
+
+    def load(path):
+        start = time.perf_counter()
+        if path == serving_path and not os.path.exists(os.path.join(path, metadata_file)):
+            # First start without an exported model: evaluate and export it once.
+            # Registry versions are never built here: a missing one raises, so
+            # the previous model stays in service.
+            from price_properties_model import build_artifact
+            build_artifact(path)
+        artifact = load_serving_artifact(path)
+        trace.record('model_load', time.perf_counter() - start)
+        return artifact
+
+    return ActiveModel(fallback_path=serving_path, loader=load, background=True)
+
+
+@st.cache_data
+def read_regions(path):
+    return read_metadata(path)['regions']
+
+
+def serving_regions():
+    # Region names and averages for the form, from the loaded model or, while
+    # it is still loading, from the metadata of the artifact being loaded
+    holder = load_model()
+    if holder.current is not None:
+        return holder.current.metadata['regions']
+    version = active_version()
+    path = version_path(version) if version else serving_path
+    if not os.path.exists(os.path.join(path, metadata_file)):
+        # Nothing exported yet: the background load is training the model
+        with st.spinner(t['loading_model']):
+            return holder.wait().metadata['regions']
+    return read_regions(path)
+
+
+def serving_artifact():
+    # The loaded model, waiting for the background load when needed
+    holder = load_model()
+    if holder.current is None:
+        with st.spinner(t['loading_model']):
+            return holder.wait()
+    return holder.current
+
+
+# Prediction cache shared by all sessions; keyed by model version, so a
+# hot-swapped model never serves the previous model's predictions
+@st.cache_resource
+def prediction_cache():
+    return PredictionCache(maxsize=10_000, ttl=3600)
+
 
-    return model, le, regions_ar, regions_en, df
+# Worker threads shared by all sessions: concurrent valuations are batched
+# into one predict call instead of contending for the interpreter
+@st.cache_resource
+def inference_pool():
+    from inference_pool import InferencePool
+    return InferencePool(n_workers=2, max_batch=64)
 
 
-model, le, regions_ar, regions_en, df = load_model()
+# Startup trace: imports above, the region metadata for the form, the first
+# render below and (recorded by the background thread) the model load
+trace = startup_trace()
+trace.record('imports', imports_seconds)
+start = time.perf_counter()
+serving_regions()
+data_seconds = time.perf_counter() - start
+trace.record('data_load', data_seconds)
 
 # Header
 st.markdown(f"""
@@ -630,207 +730,289 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-# Main Layout
-col_left, col_right = st.columns([1.2, 1], gap="large")
-
-with col_left:
-    st.markdown(
-        f"<div class='input-section'><div class='section-header'><span class='section-icon'>📍</span>{t['location']}</div>",
-        unsafe_allow_html=True)
-
-    # Prepare region options based on language
-    if lang == 'ar':
-        region_options = regions_ar
-    else:
-        region_options = [regions_en[r] for r in regions_ar]
-
-    # Get default index
-    if st.session_state.selected_region is None:
-        default_index = 0
-    else:
-        try:
-            default_index = region_options.index(st.session_state.selected_region)
-        except ValueError:
-            default_index = 0
-
-    # Selectbox with session state and placeholder
-    region = st.selectbox(
-        t['region'],
-        options=region_options,
-        index=default_index,
-        key='region_selectbox',
-        placeholder="Choose a region..." if lang == 'en' else "اختر منطقة..."
-    )
-
-    # Save selected region to session state
-    st.session_state.selected_region = region
-
-    # Show selected region clearly for visual feedback
-    if region:
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, #2a5298 0%, #1e3c72 100%); 
-                    padding: 0.75rem 1.25rem; 
-                    border-radius: 10px; 
-                    margin-top: 0.5rem;
-                    text-align: center;
-                    box-shadow: 0 2px 8px rgba(42, 82, 152, 0.25);'>
-            <span style='color: rgba(255,255,255,0.8); 
-                         font-size: 0.85rem; 
-                         font-weight: 600;
-                         text-transform: uppercase;
-                         letter-spacing: 1px;'>
-                {'Selected Region' if lang == 'en' else 'المنطقة المختارة'}
-            </span>
-            <div style='color: #ffffff; 
-                        font-size: 1.3rem; 
-                        font-weight: 700; 
-                        margin-top: 0.25rem;'>
-                {region}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Convert to Arabic region name for model
-    if lang == 'ar':
-        region_ar = region
-    else:
-        region_ar = regions_ar[region_options.index(region)]
-
-    col1, col2 = st.columns(2)
-    with col1:
-        area = st.number_input(t['area'], 50, 1000, 150, 10)
-        rooms = st.number_input(t['bedrooms'], 1, 10, 3, 1)
-    with col2:
-        bathrooms = st.number_input(t['bathrooms'], 1, 5, 2, 1)
-        age = st.number_input(t['age'], 0, 100, 5, 1)
-
-    floor = st.number_input(t['floor'], 0, 20, 3, 1)
-
-    st.markdown("</div>", unsafe_allow_html=True)
-
+# Bulk Valuation
+if mode == 'bulk':
     st.markdown(
-        f"<div class='input-section'><div class='section-header'><span class='section-icon'>✨</span>{t['features']}</div>",
+        f"<div class='input-section'><div class='section-header'><span class='section-icon'>📄</span>{t['bulk_title']}</div>",
         unsafe_allow_html=True)
-
-    col1, col2 = st.columns(2)
-    with col1:
-        elevator = st.checkbox(t['elevator'], value=True)
-        parking = st.checkbox(t['parking'], value=True)
-    with col2:
-        garden = st.checkbox(t['garden'], value=False)
-        heating = st.checkbox(t['heating'], value=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-    services = st.slider(t['services'], 1, 10, 7)
+    st.caption(t['bulk_help'])
+    uploaded = st.file_uploader(t['upload'], type=['csv', 'parquet'])
+
+    if uploaded is not None:
+        from bulk_valuation import error_column, read_table, to_file_bytes, value_table
+
+        # One snapshot per run, so a swap never mixes two models within a request
+        artifact = serving_artifact()
+        # Valued once per file and model version; reruns (e.g. the download) reuse the result
+        bulk_key = (uploaded.file_id, artifact.version)
+        if st.session_state.get('bulk_key') != bulk_key:
+            try:
+                table = read_table(uploaded, uploaded.name)
+                progress_bar = st.progress(0.0, text=t['valuing'])
+                start = time.perf_counter()
+                results = value_table(table, artifact, progress=lambda done, total: progress_bar.progress(
+                    done / total, text=f"{t['valuing']}: {done:,} / {total:,}"))
+                seconds = time.perf_counter() - start
+            except ValueError as exc:
+                st.error(str(exc))
+                st.stop()
+            file_format = 'parquet' if uploaded.name.lower().endswith('.parquet') else 'csv'
+            st.session_state.bulk_key = bulk_key
+            st.session_state.bulk_results = {
+                'preview': results.head(100),
+                'rows': len(results),
+                'invalid': int((results[error_column] != '').sum()) if error_column in results else 0,
+                'seconds': seconds,
+                'file': to_file_bytes(results, file_format),
+                'file_name': os.path.splitext(uploaded.name)[0] + '_valued.' + file_format,
+            }
+
+        bulk = st.session_state.bulk_results
+        st.success(t['valued'].format(valid=bulk['rows'] - bulk['invalid'], seconds=bulk['seconds']))
+        if bulk['invalid']:
+            st.warning(t['invalid_rows'].format(invalid=bulk['invalid']))
+        st.dataframe(bulk['preview'], use_container_width=True)
+        st.download_button(t['download'], data=bulk['file'], file_name=bulk['file_name'],
+                           mime='application/octet-stream')
 
     st.markdown("</div>", unsafe_allow_html=True)
+    st.stop()
+
+# Valuation Panel: the inputs are gathered in a form, so editing a widget
+# reruns nothing; submitting reruns only this fragment, not the CSS, header
+# and sidebar above
+@st.fragment
+def valuation_panel():
+    regions = serving_regions()
+    regions_ar, regions_en = regions['regions_ar'], regions['regions_en']
+
+    col_left, col_right = st.columns([1.2, 1], gap="large")
+
+    with col_left:
+        with st.form('valuation_form', border=False):
+            st.markdown(
+                f"<div class='input-section'><div class='section-header'><span class='section-icon'>📍</span>{t['location']}</div>",
+                unsafe_allow_html=True)
+
+            # Prepare region options based on language
+            if lang == 'ar':
+                region_options = regions_ar
+            else:
+                region_options = [regions_en[r] for r in regions_ar]
+
+            # Get default index
+            if st.session_state.selected_region is None:
+                default_index = 0
+            else:
+                try:
+                    default_index = region_options.index(st.session_state.selected_region)
+                except ValueError:
+                    default_index = 0
+
+            # Selectbox with session state and placeholder
+            region = st.selectbox(
+                t['region'],
+                options=region_options,
+                index=default_index,
+                key='region_selectbox',
+                placeholder="Choose a region..." if lang == 'en' else "اختر منطقة..."
+            )
 
-    predict_button = st.button(t['calculate'])
-
-with col_right:
-    if predict_button:
-        region_encoded = le.transform([region_ar])[0]
-
-        input_data = pd.DataFrame({
-            'المساحة_متر': [area],
-            'عدد_الغرف': [rooms],
-            'عدد_الحمامات': [bathrooms],
-            'عمر_البناء_سنوات': [age],
-            'طابق': [floor],
-            'يوجد_مصعد': [1 if elevator else 0],
-            'يوجد_موقف': [1 if parking else 0],
-            'يوجد_حديقة': [1 if garden else 0],
-            'يوجد_تدفئة_مركزية': [1 if heating else 0],
-            'قرب_الخدمات': [services],
-            'المنطقة_رقم': [region_encoded]
-        })
-
-        predicted_price = model.predict(input_data)[0]
-        region_avg = df[df['المنطقة'] == region_ar]['السعر_دينار'].mean()
-        diff_percent = ((predicted_price - region_avg) / region_avg) * 100
-
-        trend_icon = '↑' if diff_percent > 0 else '↓'
-        trend_color = '#10b981' if diff_percent > 0 else '#ef4444'
-        trend_text = t['above'] if diff_percent > 0 else t['below']
-
-        st.markdown(f"""
-            <div class='result-card'>
-                <div class='result-content'>
-                    <div class='result-badge'>{t['estimated']}</div>
-                    <div class='result-price'>{predicted_price:,.0f}</div>
-                    <div class='result-currency'>{t['currency']}</div>
-                    <div class='trend-container'>
-                        <div class='trend-content'>
-                            <span class='trend-icon' style='color: {trend_color};'>{trend_icon}</span>
-                            <p class='trend-text'>{abs(diff_percent):.1f}% {trend_text}</p>
+            # Save selected region to session state
+            st.session_state.selected_region = region
+
+            # Show selected region clearly for visual feedback
+            if region:
+                st.markdown(f"""
+                <div style='background: linear-gradient(135deg, #2a5298 0%, #1e3c72 100%); 
+                            padding: 0.75rem 1.25rem; 
+                            border-radius: 10px; 
+                            margin-top: 0.5rem;
+                            text-align: center;
+                            box-shadow: 0 2px 8px rgba(42, 82, 152, 0.25);'>
+                    <span style='color: rgba(255,255,255,0.8); 
+                                 font-size: 0.85rem; 
+                                 font-weight: 600;
+                                 text-transform: uppercase;
+                                 letter-spacing: 1px;'>
+                        {'Selected Region' if lang == 'en' else 'المنطقة المختارة'}
+                    </span>
+                    <div style='color: #ffffff; 
+                                font-size: 1.3rem; 
+                                font-weight: 700; 
+                                margin-top: 0.25rem;'>
+                        {region}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            # Convert to Arabic region name for model
+            if lang == 'ar':
+                region_ar = region
+            else:
+                region_ar = regions_ar[region_options.index(region)]
+
+            col1, col2 = st.columns(2)
+            with col1:
+                area = st.number_input(t['area'], 50, 1000, 150, 10)
+                rooms = st.number_input(t['bedrooms'], 1, 10, 3, 1)
+            with col2:
+                bathrooms = st.number_input(t['bathrooms'], 1, 5, 2, 1)
+                age = st.number_input(t['age'], 0, 100, 5, 1)
+
+            floor = st.number_input(t['floor'], 0, 20, 3, 1)
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+            st.markdown(
+                f"<div class='input-section'><div class='section-header'><span class='section-icon'>✨</span>{t['features']}</div>",
+                unsafe_allow_html=True)
+
+            col1, col2 = st.columns(2)
+            with col1:
+                elevator = st.checkbox(t['elevator'], value=True)
+                parking = st.checkbox(t['parking'], value=True)
+            with col2:
+                garden = st.checkbox(t['garden'], value=False)
+                heating = st.checkbox(t['heating'], value=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            services = st.slider(t['services'], 1, 10, 7)
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+            submitted = st.form_submit_button(t['calculate'])
+
+    with col_right:
+        if submitted:
+            import plotly.graph_objects as go
+
+            # Fresh snapshot per submission, so a hot-swapped model is picked up
+            artifact = serving_artifact()
+            encoder, region_index, region_avgs = artifact.feature_encoder, artifact.region_index, artifact.region_avg
+
+            # float32 row in the training feature order, built without a DataFrame
+            input_row = encoder.encode_row((area, rooms, bathrooms, age, floor, elevator, parking,
+                                            garden, heating, services), region_ar)
+
+            def predict_row():
+                # Batched with other sessions' requests by the shared worker pool;
+                # forests also give a 10th-90th percentile band of their trees
+                return inference_pool().predict(artifact, input_row)
+
+            # Repeated configurations (reruns, language/theme switches) come from the shared cache
+            predicted_price, price_low, price_high = prediction_cache().get_or_compute(
+                artifact.version, input_row, predict_row)
+            price_range = ''
+            if price_low is not None:
+                price_range = f"<div class='result-range'>{t['interval']}: {price_low:,.0f} - {price_high:,.0f}</div>"
+            # Region statistics come from the index built at export time; the
+            # percentile rank is a binary search over the region's sorted prices
+            region_percentile = ''
+            if region_index is not None:
+                region_avg = region_index.stats(region_ar)['mean']
+                region_percentile = f"""
+                <div class='info-card-mini'>
+                    <div class='label'>{t['percentile']}</div>
+                    <div class='value'>{region_index.percentile_rank(region_ar, predicted_price):.0f}%</div>
+                </div>"""
+            else:
+                region_avg = region_avgs[region_ar]
+            diff_percent = ((predicted_price - region_avg) / region_avg) * 100
+
+            trend_icon = '↑' if diff_percent > 0 else '↓'
+            trend_color = '#10b981' if diff_percent > 0 else '#ef4444'
+            trend_text = t['above'] if diff_percent > 0 else t['below']
+
+            st.markdown(f"""
+                <div class='result-card'>
+                    <div class='result-content'>
+                        <div class='result-badge'>{t['estimated']}</div>
+                        <div class='result-price'>{predicted_price:,.0f}</div>
+                        <div class='result-currency'>{t['currency']}</div>
+                        {price_range}
+                        <div class='trend-container'>
+                            <div class='trend-content'>
+                                <span class='trend-icon' style='color: {trend_color};'>{trend_icon}</span>
+                                <p class='trend-text'>{abs(diff_percent):.1f}% {trend_text}</p>
+                            </div>
                         </div>
                     </div>
                 </div>
-            </div>
-        """, unsafe_allow_html=True)
+            """, unsafe_allow_html=True)
 
-        st.markdown(f"""
-        <div class='info-grid'>
-            <div class='info-card-mini'>
-                <div class='label'>{t['price_sqm']}</div>
-                <div class='value'>{predicted_price / area:,.0f}</div>
-            </div>
-            <div class='info-card-mini'>
-                <div class='label'>{t['region_avg']}</div>
-                <div class='value'>{region_avg:,.0f}</div>
+            st.markdown(f"""
+            <div class='info-grid'>
+                <div class='info-card-mini'>
+                    <div class='label'>{t['price_sqm']}</div>
+                    <div class='value'>{predicted_price / area:,.0f}</div>
+                </div>
+                <div class='info-card-mini'>
+                    <div class='label'>{t['region_avg']}</div>
+                    <div class='value'>{region_avg:,.0f}</div>
+                </div>{region_percentile}
             </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown(f"<div class='chart-section'><div class='chart-title'>{t['comparison']}</div>",
-                    unsafe_allow_html=True)
-
-        bar_color = '#2a5298' if theme == 'light' else '#60a5fa'
-        avg_color = '#94a3b8' if theme == 'light' else '#475569'
-        grid_color = '#e2e8f0' if theme == 'light' else '#334155'
-
-        fig = go.Figure(data=[
-            go.Bar(
-                x=[t['your_property'], t['regional_avg']],
-                y=[predicted_price, region_avg],
-                marker=dict(
-                    color=[bar_color, avg_color],
-                    line=dict(color=bar_color, width=2)
+            """, unsafe_allow_html=True)
+
+            st.markdown(f"<div class='chart-section'><div class='chart-title'>{t['comparison']}</div>",
+                        unsafe_allow_html=True)
+
+            bar_color = '#2a5298' if theme == 'light' else '#60a5fa'
+            avg_color = '#94a3b8' if theme == 'light' else '#475569'
+            grid_color = '#e2e8f0' if theme == 'light' else '#334155'
+
+            fig = go.Figure(data=[
+                go.Bar(
+                    x=[t['your_property'], t['regional_avg']],
+                    y=[predicted_price, region_avg],
+                    marker=dict(
+                        color=[bar_color, avg_color],
+                        line=dict(color=bar_color, width=2)
+                    ),
+                    text=[f'{predicted_price:,.0f}', f'{region_avg:,.0f}'],
+                    textposition='outside',
+                    textfont=dict(size=14, weight=700, color=text_primary)
+                )
+            ])
+
+            fig.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                height=280,
+                margin=dict(t=40, b=30, l=20, r=20),
+                yaxis=dict(
+                    showgrid=True,
+                    gridcolor=grid_color,
+                    showticklabels=True,
+                    tickfont=dict(size=11, color=text_secondary)
+                ),
+                xaxis=dict(
+                    showgrid=False,
+                    tickfont=dict(size=12, weight=600, color=text_primary)
                 ),
-                text=[f'{predicted_price:,.0f}', f'{region_avg:,.0f}'],
-                textposition='outside',
-                textfont=dict(size=14, weight=700, color=text_primary)
+                font=dict(family='Inter, sans-serif')
             )
-        ])
-
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            height=280,
-            margin=dict(t=40, b=30, l=20, r=20),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor=grid_color,
-                showticklabels=True,
-                tickfont=dict(size=11, color=text_secondary)
-            ),
-            xaxis=dict(
-                showgrid=False,
-                tickfont=dict(size=12, weight=600, color=text_primary)
-            ),
-            font=dict(family='Inter, sans-serif')
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown("</div>", unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
-            <div class='result-card'>
-                <div class='result-content'>
-                    <div class='result-badge'>{t['ready']}</div>
-                    <div style='font-size: 4rem; margin: 2rem 0;'>🏢</div>
-                    <div class='result-currency' style='margin-bottom: 1rem;'>{t['enter_details']}</div>
-                    <div class='result-currency'>"{t['calculate']}"</div>
+
+            st.plotly_chart(fig, use_container_width=True)
+            st.markdown("</div>", unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+                <div class='result-card'>
+                    <div class='result-content'>
+                        <div class='result-badge'>{t['ready']}</div>
+                        <div style='font-size: 4rem; margin: 2rem 0;'>🏢</div>
+                        <div class='result-currency' style='margin-bottom: 1rem;'>{t['enter_details']}</div>
+                        <div class='result-currency'>"{t['calculate']}"</div>
+                    </div>
                 </div>
-            </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+            """, unsafe_allow_html=True)
+
+    # Prediction cache and pool counters (shared by every session of this server);
+    # the pool starts with the first valuation
+    st.sidebar.caption(t['cache_stats'].format(**prediction_cache().stats()))
+    if load_model().current is not None:
+        st.sidebar.caption(t['pool_stats'].format(**inference_pool().stats()))
+
+
+valuation_panel()
+trace.record('first_render', time.perf_counter() - script_start - imports_seconds - data_seconds)